@@ -9,7 +9,12 @@ __version__ = "1.0.0"
 __author__ = "Carl Edwards"
 __description__ = "Real-time Meshtastic mesh network traffic monitor"
 
-from .monitor import MeshtasticUDPDecoder
+def __getattr__(name):
+    """Import the decoder on first access so --help skips loading crypto and protobuf"""
+    if name == 'MeshtasticUDPDecoder':
+        from .monitor import MeshtasticUDPDecoder
+        return MeshtasticUDPDecoder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def main():
     """Main entry point for the UDP monitor"""
@@ -4,26 +4,33 @@ Entry point for running meshtastic_udp_monitor as a module
 Usage: python -m meshtastic_udp_monitor
 """
 
-import argparse
 import sys
 import os
+import functools
 from datetime import datetime
-from .monitor import MeshtasticUDPDecoder
+from types import SimpleNamespace
 
 def cmd_monitor(args):
     """Handle monitor command"""
+    from .monitor import MeshtasticUDPDecoder
     decoder = MeshtasticUDPDecoder(
         verbose=args.verbose, 
         capture_dir=args.capture_dir,
-        node_db_file=getattr(args, 'node_db', None)
+        node_db_file=getattr(args, 'node_db', None),
+        psk_brute=getattr(args, 'psk_brute', False),
+        count_only=getattr(args, 'count_only', False),
+        verbose_hex_max_bytes=getattr(args, 'hex_max_bytes', 64)
     )
     decoder.start_monitoring()
 
 def cmd_replay(args):
     """Handle replay command"""
+    from .monitor import MeshtasticUDPDecoder
     decoder = MeshtasticUDPDecoder(
         verbose=args.verbose,
-        node_db_file=getattr(args, 'node_db', None)
+        node_db_file=getattr(args, 'node_db', None),
+        psk_brute=getattr(args, 'psk_brute', False),
+        verbose_hex_max_bytes=getattr(args, 'hex_max_bytes', 64)
     )
     
     if args.input:
@@ -36,8 +43,21 @@ def cmd_replay(args):
         # Replay from stdin
         decoder.replay_stdin(update_db=getattr(args, 'update_db', False))
 
-def main():
-    """Main entry point with subcommand parsing"""
+def _non_negative_int(value):
+    """argparse type for counts where 0 means no limit"""
+    import argparse
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser once and reuse it for later main() calls"""
+    import argparse
     parser = argparse.ArgumentParser(
         prog="python -m meshtastic_udp_monitor",
         description="Real-time Meshtastic mesh network traffic monitor",
@@ -74,6 +94,23 @@ Examples:
         '--node-db',
         help='Node database file (JSONL format) to track node information'
     )
+    monitor_parser.add_argument(
+        '--psk-brute',
+        action='store_true',
+        help='Also try 256 speculative default-PSK variants on packets no known key decrypts (slow)'
+    )
+    monitor_parser.add_argument(
+        '--count-only',
+        action='store_true',
+        help='Only count packets and bytes, skipping decoding and per-packet output (statistics shown on exit)'
+    )
+    monitor_parser.add_argument(
+        '--hex-max-bytes',
+        type=_non_negative_int,
+        default=64,
+        metavar='N',
+        help='Limit verbose hex dumps to the first N bytes of each payload (0 for no limit, default: 64)'
+    )
     monitor_parser.set_defaults(func=cmd_monitor)
     
     # Replay command
@@ -97,24 +134,34 @@ Examples:
         action='store_true',
         help='Update the node database with information found during replay'
     )
+    replay_parser.add_argument(
+        '--psk-brute',
+        action='store_true',
+        help='Also try 256 speculative default-PSK variants on packets no known key decrypts (slow)'
+    )
+    replay_parser.add_argument(
+        '--hex-max-bytes',
+        type=_non_negative_int,
+        default=64,
+        metavar='N',
+        help='Limit verbose hex dumps to the first N bytes of each payload (0 for no limit, default: 64)'
+    )
     replay_parser.set_defaults(func=cmd_replay)
     
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main entry point with subcommand parsing"""
+    # Fast path: a bare or -v only invocation is plain monitoring and needs no argparse
+    argv = sys.argv[1:]
+    if not argv or argv in (['-v'], ['--verbose']):
+        cmd_monitor(SimpleNamespace(verbose=bool(argv), capture_dir=None, node_db=None))
+        return
     
-    # If no command specified, default to monitor
-    if args.command is None:
-        # Check if there are any monitor-specific args in the root
-        # For backward compatibility, support -v at root level
-        if len(sys.argv) > 1 and ('-v' in sys.argv or '--verbose' in sys.argv):
-            args.verbose = True
-        else:
-            args.verbose = False
-        args.capture_dir = None
-        cmd_monitor(args)
-    else:
-        # Execute the specified command
-        args.func(args)
+    # Parse arguments and execute the specified command. Any other argv without a
+    # subcommand is rejected by the root parser, so a command is always set here.
+    args = _build_parser().parse_args()
+    args.func(args)
 
 if __name__ == "__main__":
     main()
@@ -15,35 +15,368 @@ import os
 import glob
 import json
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 import threading
+import queue
 import base64
+import bisect
+import math
+import functools
+import binascii
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 
 # Import the actual Meshtastic protobuf definitions
 try:
-    from meshtastic import mesh_pb2, portnums_pb2, telemetry_pb2
+    try:
+        from meshtastic.protobuf import mesh_pb2, portnums_pb2, telemetry_pb2
+    except ImportError:
+        # meshtastic < 2.3 shipped the generated modules at the package top level
+        from meshtastic import mesh_pb2, portnums_pb2, telemetry_pb2
+    from google.protobuf.message import DecodeError
     PROTOBUF_AVAILABLE = True
 except ImportError as e:
     print(f"✗ Error importing Meshtastic protobufs: {e}")
     print("Install with: pip install meshtastic")
     sys.exit(1)
 
+# protobuf picks its fastest available backend (upb, then cpp); the pure-Python one
+# is an order of magnitude slower at ParseFromString, so make that fallback visible
+from google.protobuf.internal import api_implementation
+if api_implementation.Type() == 'python':
+    print("Warning: protobuf is using its pure-Python implementation; packet decoding will be slow")
+    print("Install a protobuf>=4.21 wheel for your platform to get the native (upb) backend")
+
+# Default channel keys - from Meshtastic source code
+# The actual PSKs from src/mesh/Channels.h and userPrefs.jsonc
+_DEFAULT_PSK = bytes([0xd4, 0xf1, 0xbb, 0x3a, 0x20, 0x29, 0x07, 0x59,
+                      0xf0, 0xbc, 0xff, 0xab, 0xcf, 0x4e, 0x69, 0x01])
+
+# Event PSK (32-byte AES-256 key) - also used as USERPREFS_CHANNEL_0_PSK
+_EVENT_PSK = bytes([0x38, 0x4b, 0xbc, 0xc0, 0x1d, 0xc0, 0x22, 0xd1, 0x81, 0xbf, 0x36,
+                    0xb8, 0x61, 0x21, 0xe1, 0xfb, 0x96, 0xb7, 0x2e, 0x55, 0xbf, 0x74,
+                    0x22, 0x7e, 0x9d, 0x6a, 0xfb, 0x48, 0xd6, 0x4c, 0xb1, 0xa1])
+
+# Predefined PSKs from userPrefs.jsonc
+_CHANNEL_1_PSK = bytes([0x4e, 0x22, 0x1d, 0x8b, 0xc3, 0x09, 0x1b, 0xe2, 0x11, 0x9c, 0x89, 0x12, 
+                        0xf2, 0x25, 0x19, 0x5d, 0x15, 0x3e, 0x30, 0x7b, 0x86, 0xb6, 0xec, 0xc4, 
+                        0x6a, 0xc3, 0x96, 0x5e, 0x9e, 0x10, 0x9d, 0xd5])
+
+_CHANNEL_2_PSK = bytes([0x15, 0x6f, 0xfe, 0x46, 0xd4, 0x56, 0x63, 0x8a, 0x54, 0x43, 0x13, 0xf2, 
+                        0xef, 0x6c, 0x63, 0x89, 0xf0, 0x06, 0x30, 0x52, 0xce, 0x36, 0x5e, 0xb1, 
+                        0xe8, 0xbb, 0x86, 0xe6, 0x26, 0x5b, 0x1d, 0x58])
+
+def _build_psk_variants():
+    """Generate PSK variants for different pskIndex values"""
+    psk_variants = []
+    for psk_index in range(0, 256):  # Try pskIndex 0-255 (including 0 for no encryption)
+        if psk_index == 0:
+            # pskIndex 0 means no encryption - but we still need a key for the hash calculation
+            psk_variants.append((b'\x00' * 16, "No encryption (pskIndex 0)"))
+        else:
+            variant = bytearray(_DEFAULT_PSK)
+            variant[-1] = (variant[-1] + psk_index - 1) % 256
+            psk_variants.append((bytes(variant), f"PSK variant (index {psk_index})"))
+    return psk_variants
+
+# Real PSKs in priority order (most common first), built once at import.
+# AES-256 keys are truncated to 16 bytes for AES-128 here rather than on every attempt.
+_CHANNEL_KEYS = tuple((psk[:16], key_name) for psk, key_name in (
+    (_DEFAULT_PSK, "Default PSK (index 1)"),
+    (_CHANNEL_1_PSK, "Channel 1 (NodeChat)"),
+    (_CHANNEL_2_PSK, "Channel 2 (YardSale)"),
+    (_EVENT_PSK, "Event PSK (32-byte)"),
+))
+
+# Speculative pskIndex variants, only tried when brute forcing is requested
+_PSK_VARIANT_KEYS = tuple(_build_psk_variants())
+
+# First bytes of a plausible decrypted message: varint field tags for fields 1-15
+_VALID_PB_TAGS = frozenset({0x08, 0x10, 0x18, 0x20, 0x28, 0x30, 0x38, 0x40, 0x48, 0x50, 0x58, 0x60, 0x68, 0x70, 0x78})
+
+# 128-bit AES-CTR nonce: packetId as 64-bit little-endian, fromNode as 32-bit little-endian,
+# then 4 zero bytes (no extraNonce for regular packets)
+_NONCE_STRUCT = struct.Struct('<QI4x')
+
+# Raw layouts guessed at when protobuf parsing of a payload fails:
+# telemetry as voltage and temperature floats, position as latitude_i and longitude_i
+_TELEMETRY_FALLBACK = struct.Struct('<2f')
+_VOLTAGE_FALLBACK = struct.Struct('<f')
+_POSITION_FALLBACK = struct.Struct('<2i')
+
+# Hex dump ASCII column: printable characters map to themselves, everything else to '.'
+_ASCII_TABLE = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+
+# Signal quality ratings: a value at or above thresholds[i] rates at least quality[i + 1]
+_SNR_THRESHOLDS = (-5, 0, 5, 10)
+_SNR_QUALITY = ("Very Poor", "Poor", "Fair", "Good", "Excellent")
+_RSSI_THRESHOLDS = (-90, -80, -70, -60, -50)
+_RSSI_QUALITY = ("Very Poor", "Poor", "Fair", "Good", "Very Good", "Excellent")
+
+# Channel names used when a channel has no explicit name (derived from the modem preset)
+_MODEM_PRESET_NAMES = ("LongFast", "LongSlow", "LongModerate", "LongTurbo", "VeryLongSlow",
+                       "MediumSlow", "MediumFast", "ShortSlow", "ShortFast", "ShortTurbo")
+
+def _xor_hash(data):
+    """XOR all bytes together like Meshtastic's xorHash in Channels.cpp"""
+    result = 0
+    for b in data:
+        result ^= b
+    return result
+
+def _channel_hash(name, psk):
+    """Compute the 1-byte channel hash like Channels::generateHash"""
+    return _xor_hash(name.encode('utf-8')) ^ _xor_hash(psk)
+
+def _build_keys_by_hash():
+    """Map known channel hashes to the key that produces them"""
+    known_channels = [(name, _DEFAULT_PSK, "Default PSK (index 1)") for name in _MODEM_PRESET_NAMES]
+    known_channels += [
+        ("NodeChat", _CHANNEL_1_PSK, "Channel 1 (NodeChat)"),
+        ("YardSale", _CHANNEL_2_PSK, "Channel 2 (YardSale)"),
+    ]
+    keys_by_hash = {}
+    for name, psk, key_name in known_channels:
+        # Earlier (more common) channels win on hash collisions; the hash uses the full PSK
+        keys_by_hash.setdefault(_channel_hash(name, psk), (psk[:16], key_name))
+    return keys_by_hash
+
+_KEYS_BY_HASH = _build_keys_by_hash()
+
+# Hashes of preset-named channels with no PSK, whose payloads are sent unencrypted
+_NO_PSK_HASHES = frozenset(_channel_hash(name, b'') for name in _MODEM_PRESET_NAMES)
+
+# Human-readable names for MeshPacket priorities
+_PRIORITY_NAMES = {
+    mesh_pb2.MeshPacket.Priority.UNSET: "UNSET",
+    mesh_pb2.MeshPacket.Priority.MIN: "MIN",
+    mesh_pb2.MeshPacket.Priority.BACKGROUND: "BACKGROUND", 
+    mesh_pb2.MeshPacket.Priority.DEFAULT: "DEFAULT",
+    mesh_pb2.MeshPacket.Priority.RELIABLE: "RELIABLE",
+    mesh_pb2.MeshPacket.Priority.RESPONSE: "RESPONSE",
+    mesh_pb2.MeshPacket.Priority.HIGH: "HIGH",
+    mesh_pb2.MeshPacket.Priority.ALERT: "ALERT",
+    mesh_pb2.MeshPacket.Priority.ACK: "ACK",
+    mesh_pb2.MeshPacket.Priority.MAX: "MAX"
+}
+
+# Port number names, taken from the protobuf enum so new ports are picked up automatically
+_PORT_NAMES = {value: name for name, value in portnums_pb2.PortNum.items()}
+
+# Hardware model mapping from actual meshtastic firmware source
+# Based on meshtastic/mesh.pb.h from the official firmware repository
+_HW_MODELS = {
+    0: "UNSET",
+    1: "TLORA_V2",
+    2: "TLORA_V1", 
+    3: "TLORA_V2_1_1P6",
+    4: "TBEAM",
+    5: "HELTEC_V2_0",
+    6: "TBEAM_V0P7",
+    7: "T_ECHO",
+    8: "TLORA_V1_1P3",
+    9: "RAK4631",
+    10: "HELTEC_V2_1",
+    11: "HELTEC_V1",
+    12: "LILYGO_TBEAM_S3_CORE",
+    13: "RAK11200",
+    14: "NANO_G1",
+    15: "TLORA_V2_1_1P8",
+    16: "TLORA_T3_S3",
+    17: "NANO_G1_EXPLORER",
+    18: "NANO_G2_ULTRA",
+    19: "LORA_TYPE",
+    20: "WIPHONE",
+    21: "WIO_WM1110",
+    22: "RAK2560",
+    23: "HELTEC_HRU_3601",
+    24: "HELTEC_WIRELESS_BRIDGE",
+    25: "STATION_G1",
+    26: "RAK11310",
+    27: "SENSELORA_RP2040",
+    28: "SENSELORA_S3",
+    29: "CANARYONE",
+    30: "RP2040_LORA",
+    31: "STATION_G2",
+    32: "LORA_RELAY_V1",
+    33: "NRF52840DK",
+    34: "PPR",
+    35: "GENIEBLOCKS",
+    36: "NRF52_UNKNOWN",
+    37: "PORTDUINO",
+    38: "ANDROID_SIM",
+    39: "DIY_V1",
+    40: "NRF52840_PCA10059",
+    41: "DR_DEV",
+    42: "M5STACK",
+    43: "HELTEC_V3",
+    44: "HELTEC_WSL_V3",
+    45: "BETAFPV_2400_TX",
+    46: "BETAFPV_900_NANO_TX",
+    47: "RPI_PICO",
+    48: "HELTEC_WIRELESS_TRACKER",
+    49: "HELTEC_WIRELESS_PAPER",
+    50: "T_DECK",
+    51: "T_WATCH_S3",
+    52: "PICOMPUTER_S3",
+    53: "HELTEC_HT62",
+    54: "EBYTE_ESP32_S3",
+    55: "ESP32_S3_PICO",
+    56: "CHATTER_2",
+    57: "HELTEC_WIRELESS_PAPER_V1_0",
+    58: "HELTEC_WIRELESS_TRACKER_V1_0",
+    59: "UNPHONE",
+    60: "TD_LORAC",
+    61: "CDEBYTE_EORA_S3",
+    62: "TWC_MESH_V4",
+    63: "NRF52_PROMICRO_DIY",
+    64: "RADIOMASTER_900_BANDIT_NANO",
+    65: "HELTEC_CAPSULE_SENSOR_V3",
+    66: "HELTEC_VISION_MASTER_T190",
+    67: "HELTEC_VISION_MASTER_E213",
+    68: "HELTEC_VISION_MASTER_E290",
+    69: "HELTEC_MESH_NODE_T114",
+    70: "SENSECAP_INDICATOR",
+    71: "TRACKER_T1000_E",
+    72: "RAK3172",
+    73: "WIO_E5",
+    74: "RADIOMASTER_900_BANDIT",
+    75: "ME25LS01_4Y10TD",
+    76: "RP2040_FEATHER_RFM95",
+    77: "M5STACK_COREBASIC",
+    78: "M5STACK_CORE2",
+    79: "RPI_PICO2",
+    80: "M5STACK_CORES3",
+    81: "SEEED_XIAO_S3",
+    82: "MS24SF1",
+    83: "TLORA_C6",
+    84: "WISMESH_TAP",
+    85: "ROUTASTIC",
+    86: "MESH_TAB",
+    87: "MESHLINK",
+    88: "XIAO_NRF52_KIT",
+    89: "THINKNODE_M1",
+    90: "THINKNODE_M2",
+    91: "T_ETH_ELITE",
+    92: "HELTEC_SENSOR_HUB",
+    93: "RESERVED_FRIED_CHICKEN",
+    94: "HELTEC_MESH_POCKET",
+    95: "SEEED_SOLAR_NODE",
+    96: "NOMADSTAR_METEOR_PRO",
+    97: "CROWPANEL",
+    98: "LINK_32",
+    99: "SEEED_WIO_TRACKER_L1",
+    100: "SEEED_WIO_TRACKER_L1_EINK",
+    101: "QWANTZ_TINY_ARMS",
+    102: "T_DECK_PRO",
+    103: "T_LORA_PAGER",
+    104: "GAT562_MESH_TRIAL_TRACKER",
+    255: "PRIVATE_HW"
+}
+
+# Routing.Error names, shared by the data payload and routing decoders
+_ROUTING_ERROR_NAMES = {
+    0: "NONE",
+    1: "NO_ROUTE", 
+    2: "GOT_NAK",
+    3: "TIMEOUT",
+    4: "NO_INTERFACE",
+    5: "MAX_RETRANSMIT",
+    6: "NO_CHANNEL",
+    7: "TOO_LARGE",
+    8: "NO_RESPONSE",
+    9: "DUTY_CYCLE_LIMIT"
+}
+
+# More readable port descriptions for the simple output
+_PORT_DESCRIPTIONS = {
+    "TEXT_MESSAGE_APP": "Text Message",
+    "NODEINFO_APP": "Node Information Update", 
+    "POSITION_APP": "Position Update",
+    "TELEMETRY_APP": "Telemetry Data",
+    "TRACEROUTE_APP": "Network Traceroute",
+    "ROUTING_APP": "Routing Control",
+    "ADMIN_APP": "Administration",
+    "NEIGHBORINFO_APP": "Neighbor Discovery"
+}
+
+@functools.lru_cache(maxsize=1024)
+def _format_node_id(node_id):
+    """Format node ID in hex format like Meshtastic app, cached since a mesh has few nodes"""
+    return f"!{node_id:08x}"
+
+@functools.lru_cache(maxsize=256)
+def _format_snr_db(snr_raw):
+    """Format a RouteDiscovery SNR (scaled by 4, int8 on the wire) in dB"""
+    return f"{snr_raw / 4:.1f}dB"
+
+@functools.lru_cache(maxsize=256)
+def _format_snr_value(snr_raw):
+    """Format a RouteDiscovery SNR in dB, replacing invalid/sentinel values with N/A"""
+    snr_val = snr_raw / 4.0
+    if snr_val <= -30.0 or snr_val >= 50.0:  # Reasonable SNR range is roughly -30 to +50 dB
+        return "N/A"
+    return _format_snr_db(snr_raw)
+
+def _format_packet_time(timestamp):
+    """Format a Unix timestamp as local time with milliseconds (YYYY-MM-DD HH:MM:SS.mmm)"""
+    # Round to microseconds the way datetime.fromtimestamp does, then truncate to milliseconds
+    frac, secs = math.modf(timestamp)
+    us = round(frac * 1e6)
+    if us >= 1000000:
+        secs += 1
+        us -= 1000000
+    return f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(secs))}.{us // 1000:03d}"
+
+def _hex_preview(payload, max_bytes=20):
+    """Short hex preview of a payload, hex-encoding only the bytes that are shown"""
+    return f"bytes({len(payload)}): {payload[:max_bytes].hex()}{'...' if len(payload) > max_bytes else ''}"
+
+# Number of malformed replay lines listed individually in the end-of-replay summary
+_REPLAY_WARNING_LIMIT = 5
+
+# Rule printed above each packet and around the statistics
+_SEPARATOR = "=" * 80
+
+# Interpretation keys that are read back or shared between decoders and printers
+_KEY_PORT = "Port"
+_KEY_PAYLOAD_DATA = "Payload Data"
+_KEY_DEBUG = "⚠️ Debug"
+
+# Write buffer for capture files
+_CAPTURE_BUFFER_SIZE = 64 * 1024
+
+# The capture writer flushes after this many packets or seconds, whichever comes first
+_CAPTURE_FLUSH_PACKETS = 64
+_CAPTURE_FLUSH_INTERVAL = 0.5
+
 class MeshtasticUDPDecoder:
-    def __init__(self, verbose=False, capture_dir=None, node_db_file=None):
+    def __init__(self, verbose=False, capture_dir=None, node_db_file=None, psk_brute=False, count_only=False,
+                 verbose_hex_max_bytes=64):
         self.multicast_group = '224.0.0.69'
         self.port = 4403
         self.sock = None
         self.running = False
+        # Receive buffer reused for every datagram (large enough for any UDP payload)
+        self._rx_buf = bytearray(65535)
+        self._rx_view = memoryview(self._rx_buf)
+        # Counters are only written by the decoding thread; readers (print_statistics, also
+        # called from the signal handler) may see a packet counted before its bytes
         self.packet_count = 0
         self.total_bytes = 0
         self.start_time = None
-        self.stats_lock = threading.Lock()
         self.verbose = verbose
+        self.verbose_hex_max_bytes = verbose_hex_max_bytes  # 0 or None shows whole payloads
+        self.count_only = count_only
         self.capture_dir = capture_dir
         self.capture_file = None
         self.current_capture_date = None
+        self._capture_rotate_at = None
+        self._capture_queue = None
+        self._capture_thread = None
+        self._capture_error = None
+        self._last_timestamp = None
+        self._last_timestamp_str = None
         
         # Node database functionality
         self.node_db_file = node_db_file
@@ -55,8 +388,29 @@ class MeshtasticUDPDecoder:
         if self.node_db_file:
             self.load_node_database()
         
-        # Initialize channel keys for decryption
-        self._init_channel_keys()
+        # Channel keys for decryption (shared, immutable tables)
+        self.channel_keys = _CHANNEL_KEYS + _PSK_VARIANT_KEYS if psk_brute else _CHANNEL_KEYS
+        # Channel hash -> (key, key_name); seeded with known channels, learns keys found by scanning
+        self._keys_by_hash = dict(_KEYS_BY_HASH)
+        # Payload decoders by port number; other ports are shown as raw bytes
+        self._port_decoders = {
+            portnums_pb2.PortNum.TEXT_MESSAGE_APP: self._decode_text_message,
+            portnums_pb2.PortNum.TRACEROUTE_APP: self._decode_traceroute,
+            portnums_pb2.PortNum.POSITION_APP: self._decode_position,
+            portnums_pb2.PortNum.NODEINFO_APP: self._decode_nodeinfo,
+            portnums_pb2.PortNum.TELEMETRY_APP: self._decode_telemetry,
+            portnums_pb2.PortNum.ROUTING_APP: self._decode_routing_app,
+        }
+        
+        # 16-byte key -> algorithms.AES, reused across packets instead of rebuilt per attempt
+        self._aes_algorithms = {}
+        
+        # Protobuf messages reused for every packet (ParseFromString clears them first).
+        # Packets are decoded one at a time on the receive/replay thread, so this is not reentrant.
+        self._mesh_packet = mesh_pb2.MeshPacket()
+        self._data = mesh_pb2.Data()
+        self._routing = mesh_pb2.Routing()
+        self._telemetry = telemetry_pb2.Telemetry()
     
     def load_node_database(self):
         """Load existing node database from JSONL file"""
@@ -106,7 +460,7 @@ class MeshtasticUDPDecoder:
             # Clean up temp file if it exists
             try:
                 os.unlink(temp_file)
-            except:
+            except OSError:
                 pass
     
     def update_node_info(self, node_id, node_data, update_db_file=True):
@@ -170,46 +524,6 @@ class MeshtasticUDPDecoder:
             return f"{node_id} ({name})"
         return node_id
     
-    def _init_channel_keys(self):
-        """Initialize channel keys for decryption"""
-        # Default channel keys - from Meshtastic source code
-        # The actual PSKs from src/mesh/Channels.h and userPrefs.jsonc
-        default_psk = bytes([0xd4, 0xf1, 0xbb, 0x3a, 0x20, 0x29, 0x07, 0x59,
-                            0xf0, 0xbc, 0xff, 0xab, 0xcf, 0x4e, 0x69, 0x01])
-        
-        # Event PSK (32-byte AES-256 key) - also used as USERPREFS_CHANNEL_0_PSK
-        event_psk = bytes([0x38, 0x4b, 0xbc, 0xc0, 0x1d, 0xc0, 0x22, 0xd1, 0x81, 0xbf, 0x36,
-                          0xb8, 0x61, 0x21, 0xe1, 0xfb, 0x96, 0xb7, 0x2e, 0x55, 0xbf, 0x74,
-                          0x22, 0x7e, 0x9d, 0x6a, 0xfb, 0x48, 0xd6, 0x4c, 0xb1, 0xa1])
-        
-        # Predefined PSKs from userPrefs.jsonc
-        channel_1_psk = bytes([0x4e, 0x22, 0x1d, 0x8b, 0xc3, 0x09, 0x1b, 0xe2, 0x11, 0x9c, 0x89, 0x12, 
-                              0xf2, 0x25, 0x19, 0x5d, 0x15, 0x3e, 0x30, 0x7b, 0x86, 0xb6, 0xec, 0xc4, 
-                              0x6a, 0xc3, 0x96, 0x5e, 0x9e, 0x10, 0x9d, 0xd5])
-        
-        channel_2_psk = bytes([0x15, 0x6f, 0xfe, 0x46, 0xd4, 0x56, 0x63, 0x8a, 0x54, 0x43, 0x13, 0xf2, 
-                              0xef, 0x6c, 0x63, 0x89, 0xf0, 0x06, 0x30, 0x52, 0xce, 0x36, 0x5e, 0xb1, 
-                              0xe8, 0xbb, 0x86, 0xe6, 0x26, 0x5b, 0x1d, 0x58])
-        
-        # Generate PSK variants for different pskIndex values
-        psk_variants = []
-        for psk_index in range(0, 256):  # Try pskIndex 0-255 (including 0 for no encryption)
-            if psk_index == 0:
-                # pskIndex 0 means no encryption - but we still need a key for the hash calculation
-                psk_variants.append((b'\x00' * 16, "No encryption (pskIndex 0)"))
-            else:
-                variant = bytearray(default_psk)
-                variant[-1] = (variant[-1] + psk_index - 1) % 256
-                psk_variants.append((bytes(variant), f"PSK variant (index {psk_index})"))
-        
-        # Combine all PSKs in priority order (most common first)
-        self.channel_keys = [
-            (default_psk, "Default PSK (index 1)"),
-            (channel_1_psk, "Channel 1 (NodeChat)"),
-            (channel_2_psk, "Channel 2 (YardSale)"),
-            (event_psk, "Event PSK (32-byte)"),
-        ] + psk_variants
-        
     def setup_socket(self):
         """Set up the multicast UDP socket"""
         try:
@@ -224,6 +538,9 @@ class MeshtasticUDPDecoder:
             mreq = struct.pack("4sl", socket.inet_aton(self.multicast_group), socket.INADDR_ANY)
             self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
             
+            # Receive with a timeout so the loop can notice self.running going False
+            self.sock.settimeout(1.0)
+            
             print(f"Listening for Meshtastic UDP packets on {self.multicast_group}:{self.port}")
             print("Press Ctrl+C to stop monitoring\n")
             return True
@@ -232,698 +549,186 @@ class MeshtasticUDPDecoder:
             print(f"✗ Error setting up socket: {e}")
             return False
     
-    def format_hex_dump(self, data, bytes_per_line=16):
-        """Format binary data as a hex dump with ASCII representation"""
+    def format_hex_dump(self, data, bytes_per_line=16, limit=None):
+        """Format binary data as a hex dump with ASCII representation, up to limit bytes"""
+        total = len(data)
+        if limit is not None and 0 < limit < total:
+            data = data[:limit]
+        data = bytes(data)  # Accept memoryviews from the receive buffer
         lines = []
         for i in range(0, len(data), bytes_per_line):
             chunk = data[i:i + bytes_per_line]
             
             # Hex representation
-            hex_part = ' '.join(f'{b:02x}' for b in chunk)
-            hex_part = hex_part.ljust(bytes_per_line * 3 - 1)
+            hex_part = chunk.hex(' ').ljust(bytes_per_line * 3 - 1)
             
             # ASCII representation
-            ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+            ascii_part = chunk.translate(_ASCII_TABLE).decode('ascii')
             
             lines.append(f"  {i:04x}: {hex_part} |{ascii_part}|")
         
+        if total > len(data):
+            lines.append(f"  ... {total - len(data)} more bytes")
+        
         return '\n'.join(lines)
     
     def format_node_id(self, node_id):
         """Format node ID in hex format like Meshtastic app"""
-        return f"!{node_id:08x}"
+        return _format_node_id(node_id)
     
     def format_timestamp(self, timestamp):
         """Format Unix timestamp to readable date/time"""
+        # Packets in a burst often carry the same second; reuse the last result
+        if timestamp == self._last_timestamp:
+            return self._last_timestamp_str
+        
         try:
             dt = datetime.fromtimestamp(timestamp)
-            return f"{dt.strftime('%Y-%m-%d %H:%M:%S')} ({timestamp})"
-        except:
+            formatted = f"{dt.strftime('%Y-%m-%d %H:%M:%S')} ({timestamp})"
+        except (ValueError, OverflowError, OSError):
             return f"Invalid timestamp ({timestamp})"
+        
+        self._last_timestamp = timestamp
+        self._last_timestamp_str = formatted
+        return formatted
     
     def format_rssi_snr(self, value):
         """Format RSSI/SNR values with quality indicators"""
         # Add quality indicator for SNR
-        if value >= 10:
-            quality = "Excellent"
-        elif value >= 5:
-            quality = "Good"
-        elif value >= 0:
-            quality = "Fair"
-        elif value >= -5:
-            quality = "Poor"
-        else:
-            quality = "Very Poor"
-            
+        quality = _SNR_QUALITY[bisect.bisect_right(_SNR_THRESHOLDS, value)]
         return f"{value:.1f} dB ({quality})"
     
     def format_rssi(self, rssi_val):
         """Format RSSI values with quality indicators"""
         # Add quality indicator for RSSI
-        if rssi_val >= -50:
-            quality = "Excellent"
-        elif rssi_val >= -60:
-            quality = "Very Good"
-        elif rssi_val >= -70:
-            quality = "Good"
-        elif rssi_val >= -80:
-            quality = "Fair"
-        elif rssi_val >= -90:
-            quality = "Poor"
-        else:
-            quality = "Very Poor"
-            
+        quality = _RSSI_QUALITY[bisect.bisect_right(_RSSI_THRESHOLDS, rssi_val)]
         return f"{rssi_val} dBm ({quality})"
     
     def format_priority(self, priority):
         """Format priority with human-readable names"""
-        priority_names = {
-            mesh_pb2.MeshPacket.Priority.UNSET: "UNSET",
-            mesh_pb2.MeshPacket.Priority.MIN: "MIN",
-            mesh_pb2.MeshPacket.Priority.BACKGROUND: "BACKGROUND", 
-            mesh_pb2.MeshPacket.Priority.DEFAULT: "DEFAULT",
-            mesh_pb2.MeshPacket.Priority.RELIABLE: "RELIABLE",
-            mesh_pb2.MeshPacket.Priority.RESPONSE: "RESPONSE",
-            mesh_pb2.MeshPacket.Priority.HIGH: "HIGH",
-            mesh_pb2.MeshPacket.Priority.ALERT: "ALERT",
-            mesh_pb2.MeshPacket.Priority.ACK: "ACK",
-            mesh_pb2.MeshPacket.Priority.MAX: "MAX"
-        }
-        
-        name = priority_names.get(priority, "UNKNOWN")
-        return f"{name} ({priority})"
+        return f"{_PRIORITY_NAMES.get(priority, 'UNKNOWN')} ({priority})"
     
     def construct_correct_nonce(self, packet_id, from_node):
         """Construct nonce exactly like Meshtastic does in CryptoEngine::initNonce"""
-        nonce = bytearray(16)  # 128-bit nonce
+        return _NONCE_STRUCT.pack(packet_id, from_node)
+
+    def _aes_algorithm(self, key):
+        """Get the cached AES algorithm object for a 16-byte key"""
+        algorithm = self._aes_algorithms.get(key)
+        if algorithm is None:
+            algorithm = self._aes_algorithms[key] = algorithms.AES(key)
+        return algorithm
+
+    def _aes_ctr_decrypt(self, key, nonce, encrypted_data):
+        """AES-CTR decrypt with a 16-byte key and 16-byte initial counter block"""
+        decryptor = Cipher(self._aes_algorithm(key), modes.CTR(nonce), backend=default_backend()).decryptor()
+        return decryptor.update(encrypted_data) + decryptor.finalize()
+
+    def _try_decrypt(self, key, key_name, encrypted_data, nonce):
+        """Decrypt with a single 16-byte key; return (decrypted, status, message) or None if it doesn't fit"""
+        # Decrypt the payload
+        decrypted = self._aes_ctr_decrypt(key, nonce, encrypted_data)
         
-        # First 8 bytes: packetId as 64-bit little-endian
-        struct.pack_into('<Q', nonce, 0, packet_id)
+        # A wrong key yields random bytes; reject those before paying for protobuf parsing
+        if len(decrypted) < 2 or decrypted[0] not in _VALID_PB_TAGS:
+            return None
         
-        # Next 4 bytes: fromNode as 32-bit little-endian  
-        struct.pack_into('<I', nonce, 8, from_node)
+        # Try to parse as Data protobuf first
+        try:
+            data_msg = self._data
+            data_msg.ParseFromString(decrypted)
+            
+            # Validate that this looks like a real protobuf message
+            # Check if portnum is in valid range
+            if 0 <= data_msg.portnum <= 255:
+                return decrypted, f"Success (using {key_name})", data_msg
+            
+        except DecodeError:
+            pass
         
-        # Last 4 bytes remain zero (no extraNonce for regular packets)
+        # Try parsing as Routing protobuf (for traceroute packets)
+        try:
+            routing_msg = self._routing
+            routing_msg.ParseFromString(decrypted)
+            
+            # If parsing succeeded, this is likely the correct key
+            return decrypted, f"Success (using {key_name})", routing_msg
+            
+        except DecodeError:
+            pass
         
-        return bytes(nonce)
+        # If protobuf parsing failed, the reasonable field tag checked above still suggests
+        # the key was right (sometimes the decryption works but protobuf parsing fails)
+        return decrypted, f"Partial success (using {key_name}) - protobuf parsing failed", None
 
     def decrypt_payload(self, encrypted_data, packet_id, from_node, channel_hash):
         """Attempt to decrypt the encrypted payload using available channel keys"""
-        # Try all available keys since we don't know which channel index produces this hash
-        for i, (key, key_name) in enumerate(self.channel_keys):
+        # Channels without a PSK carry the plain Data message, so skip AES entirely.
+        # An encrypted channel can share one of these hashes and random ciphertext parses as
+        # Data surprisingly often, so only accept what a real sender produces: portnum first
+        # (tag 0x08), a known non-zero port and a payload. Anything else goes to the key scan.
+        if channel_hash in _NO_PSK_HASHES and encrypted_data[:1] == b'\x08':
             try:
-                # Construct nonce CORRECTLY like Meshtastic does
-                nonce = self.construct_correct_nonce(packet_id, from_node)
-                
-                # For AES-256 keys, truncate to 16 bytes for AES-128
-                if len(key) > 16:
-                    key = key[:16]
-                
-                # Create cipher
-                cipher = Cipher(algorithms.AES(key), modes.CTR(nonce), backend=default_backend())
-                decryptor = cipher.decryptor()
-                
-                # Decrypt the payload
-                decrypted = decryptor.update(encrypted_data) + decryptor.finalize()
-                
-                # Try to parse as Data protobuf first
-                try:
-                    data_msg = mesh_pb2.Data()
-                    data_msg.ParseFromString(decrypted)
-                    
-                    # Validate that this looks like a real protobuf message
-                    # Check if portnum is in valid range
-                    if hasattr(data_msg, 'portnum') and 0 <= data_msg.portnum <= 255:
-                        return decrypted, f"Success (using {key_name})", data_msg
-                    
-                except Exception:
-                    pass
-                
-                # Try parsing as Routing protobuf (for traceroute packets)
-                try:
-                    routing_msg = mesh_pb2.Routing()
-                    routing_msg.ParseFromString(decrypted)
-                    
-                    # If parsing succeeded, this is likely the correct key
-                    return decrypted, f"Success (using {key_name})", routing_msg
-                    
-                except Exception:
-                    pass
-                
-                # If protobuf parsing failed, check if decrypted data looks reasonable
-                # (sometimes the decryption works but protobuf parsing fails)
-                if len(decrypted) > 0:
-                    # Check if it starts with reasonable protobuf field tags
-                    if decrypted[0] in [0x08, 0x10, 0x18, 0x20, 0x28, 0x30, 0x38, 0x40, 0x48, 0x50, 0x58, 0x60, 0x68, 0x70, 0x78]:
-                        # This might be valid protobuf data even if parsing failed
-                        return decrypted, f"Partial success (using {key_name}) - protobuf parsing failed", None
-                
-            except Exception as e:
-                continue  # Try next key
-        
-        # Try some additional PSK variants based on the channel hash
-        additional_keys = []
+                data_msg = self._data
+                data_msg.ParseFromString(encrypted_data)
+                if data_msg.portnum in _PORT_NAMES and data_msg.portnum and data_msg.payload:
+                    return encrypted_data, "Success (no encryption)", data_msg
+            except DecodeError:
+                pass
         
-        # Generate PSK based on channel hash
-        for base_psk in [self.channel_keys[0][0], self.channel_keys[1][0]]:  # Try default and channel 1 PSKs
-            variant = bytearray(base_psk)
-            # Modify based on channel hash
-            variant[-1] = (variant[-1] + channel_hash) % 256
-            additional_keys.append((bytes(variant), f"Hash-based variant (hash {channel_hash})"))
-        
-        # Try the additional keys
-        for key, key_name in additional_keys:
-            try:
-                nonce = self.construct_correct_nonce(packet_id, from_node)
-                
-                if len(key) > 16:
-                    key = key[:16]
-                
-                cipher = Cipher(algorithms.AES(key), modes.CTR(nonce), backend=default_backend())
-                decryptor = cipher.decryptor()
-                decrypted = decryptor.update(encrypted_data) + decryptor.finalize()
-                
-                # Try protobuf parsing
-                try:
-                    data_msg = mesh_pb2.Data()
-                    data_msg.ParseFromString(decrypted)
-                    if hasattr(data_msg, 'portnum') and 0 <= data_msg.portnum <= 255:
-                        return decrypted, f"Success (using {key_name})", data_msg
-                except:
-                    pass
-                
-                try:
-                    routing_msg = mesh_pb2.Routing()
-                    routing_msg.ParseFromString(decrypted)
-                    return decrypted, f"Success (using {key_name})", routing_msg
-                except:
-                    pass
-                    
-            except Exception:
-                continue
+        # Construct nonce CORRECTLY like Meshtastic does - it's the same for every key
+        nonce = self.construct_correct_nonce(packet_id, from_node)
+        
+        # The channel hash normally identifies the key, so try that one first
+        known_key = self._keys_by_hash.get(channel_hash)
+        if known_key:
+            result = self._try_decrypt(known_key[0], known_key[1], encrypted_data, nonce)
+            if result and result[2] is not None:
+                return result
+        
+        # Unknown hash (or the hashed key didn't fit) - try all available keys
+        for key, key_name in self.channel_keys:
+            result = self._try_decrypt(key, key_name, encrypted_data, nonce)
+            if result:
+                if result[2] is not None:
+                    # Remember the winner so later packets on this channel skip the scan
+                    self._keys_by_hash[channel_hash] = (key, key_name)
+                return result
         
         # Check if this might be PKI encrypted
         pki_hint = ""
         if len(encrypted_data) > 12:  # PKI packets have extra auth data
             pki_hint = " (Packet may use PKI encryption - requires node's private key)"
         
-        return None, f"All decryption attempts failed for channel hash {channel_hash} (tried {len(self.channel_keys) + len(additional_keys)} keys){pki_hint}", None
+        return None, f"All decryption attempts failed for channel hash {channel_hash} (tried {len(self.channel_keys)} keys){pki_hint}", None
     
     def format_snr_value(self, snr_raw):
         """Format SNR value, replacing invalid values with N/A"""
-        snr_val = snr_raw / 4.0  # SNR is scaled by 4 in protobuf
-        
-        # Check for invalid/sentinel SNR values
-        if snr_val <= -30.0 or snr_val >= 50.0:  # Reasonable SNR range is roughly -30 to +50 dB
-            return "N/A"
-        else:
-            return f"{snr_val:.1f}dB"
+        return _format_snr_value(snr_raw)
     
     def format_hardware_model(self, hw_model):
         """Format hardware model number with human-readable name"""
-        # Hardware model mapping from actual meshtastic firmware source
-        # Based on meshtastic/mesh.pb.h from the official firmware repository
-        hardware_models = {
-            0: "UNSET",
-            1: "TLORA_V2",
-            2: "TLORA_V1", 
-            3: "TLORA_V2_1_1P6",
-            4: "TBEAM",
-            5: "HELTEC_V2_0",
-            6: "TBEAM_V0P7",
-            7: "T_ECHO",
-            8: "TLORA_V1_1P3",
-            9: "RAK4631",
-            10: "HELTEC_V2_1",
-            11: "HELTEC_V1",
-            12: "LILYGO_TBEAM_S3_CORE",
-            13: "RAK11200",
-            14: "NANO_G1",
-            15: "TLORA_V2_1_1P8",
-            16: "TLORA_T3_S3",
-            17: "NANO_G1_EXPLORER",
-            18: "NANO_G2_ULTRA",
-            19: "LORA_TYPE",
-            20: "WIPHONE",
-            21: "WIO_WM1110",
-            22: "RAK2560",
-            23: "HELTEC_HRU_3601",
-            24: "HELTEC_WIRELESS_BRIDGE",
-            25: "STATION_G1",
-            26: "RAK11310",
-            27: "SENSELORA_RP2040",
-            28: "SENSELORA_S3",
-            29: "CANARYONE",
-            30: "RP2040_LORA",
-            31: "STATION_G2",
-            32: "LORA_RELAY_V1",
-            33: "NRF52840DK",
-            34: "PPR",
-            35: "GENIEBLOCKS",
-            36: "NRF52_UNKNOWN",
-            37: "PORTDUINO",
-            38: "ANDROID_SIM",
-            39: "DIY_V1",
-            40: "NRF52840_PCA10059",
-            41: "DR_DEV",
-            42: "M5STACK",
-            43: "HELTEC_V3",
-            44: "HELTEC_WSL_V3",
-            45: "BETAFPV_2400_TX",
-            46: "BETAFPV_900_NANO_TX",
-            47: "RPI_PICO",
-            48: "HELTEC_WIRELESS_TRACKER",
-            49: "HELTEC_WIRELESS_PAPER",
-            50: "T_DECK",
-            51: "T_WATCH_S3",
-            52: "PICOMPUTER_S3",
-            53: "HELTEC_HT62",
-            54: "EBYTE_ESP32_S3",
-            55: "ESP32_S3_PICO",
-            56: "CHATTER_2",
-            57: "HELTEC_WIRELESS_PAPER_V1_0",
-            58: "HELTEC_WIRELESS_TRACKER_V1_0",
-            59: "UNPHONE",
-            60: "TD_LORAC",
-            61: "CDEBYTE_EORA_S3",
-            62: "TWC_MESH_V4",
-            63: "NRF52_PROMICRO_DIY",
-            64: "RADIOMASTER_900_BANDIT_NANO",
-            65: "HELTEC_CAPSULE_SENSOR_V3",
-            66: "HELTEC_VISION_MASTER_T190",
-            67: "HELTEC_VISION_MASTER_E213",
-            68: "HELTEC_VISION_MASTER_E290",
-            69: "HELTEC_MESH_NODE_T114",
-            70: "SENSECAP_INDICATOR",
-            71: "TRACKER_T1000_E",
-            72: "RAK3172",
-            73: "WIO_E5",
-            74: "RADIOMASTER_900_BANDIT",
-            75: "ME25LS01_4Y10TD",
-            76: "RP2040_FEATHER_RFM95",
-            77: "M5STACK_COREBASIC",
-            78: "M5STACK_CORE2",
-            79: "RPI_PICO2",
-            80: "M5STACK_CORES3",
-            81: "SEEED_XIAO_S3",
-            82: "MS24SF1",
-            83: "TLORA_C6",
-            84: "WISMESH_TAP",
-            85: "ROUTASTIC",
-            86: "MESH_TAB",
-            87: "MESHLINK",
-            88: "XIAO_NRF52_KIT",
-            89: "THINKNODE_M1",
-            90: "THINKNODE_M2",
-            91: "T_ETH_ELITE",
-            92: "HELTEC_SENSOR_HUB",
-            93: "RESERVED_FRIED_CHICKEN",
-            94: "HELTEC_MESH_POCKET",
-            95: "SEEED_SOLAR_NODE",
-            96: "NOMADSTAR_METEOR_PRO",
-            97: "CROWPANEL",
-            98: "LINK_32",
-            99: "SEEED_WIO_TRACKER_L1",
-            100: "SEEED_WIO_TRACKER_L1_EINK",
-            101: "QWANTZ_TINY_ARMS",
-            102: "T_DECK_PRO",
-            103: "T_LORA_PAGER",
-            104: "GAT562_MESH_TRIAL_TRACKER",
-            255: "PRIVATE_HW"
-        }
-        
-        model_name = hardware_models.get(hw_model, f"UNKNOWN_HW_{hw_model}")
-        return f"{model_name} ({hw_model})"
+        return f"{_HW_MODELS.get(hw_model, f'UNKNOWN_HW_{hw_model}')} ({hw_model})"
 
     def format_portnum(self, portnum):
         """Format port number with human-readable name"""
-        port_names = {
-            portnums_pb2.PortNum.UNKNOWN_APP: "UNKNOWN_APP",
-            portnums_pb2.PortNum.TEXT_MESSAGE_APP: "TEXT_MESSAGE_APP",
-            portnums_pb2.PortNum.REMOTE_HARDWARE_APP: "REMOTE_HARDWARE_APP",
-            portnums_pb2.PortNum.POSITION_APP: "POSITION_APP",
-            portnums_pb2.PortNum.NODEINFO_APP: "NODEINFO_APP",
-            portnums_pb2.PortNum.ROUTING_APP: "ROUTING_APP",
-            portnums_pb2.PortNum.ADMIN_APP: "ADMIN_APP",
-            portnums_pb2.PortNum.TEXT_MESSAGE_COMPRESSED_APP: "TEXT_MESSAGE_COMPRESSED_APP",
-            portnums_pb2.PortNum.WAYPOINT_APP: "WAYPOINT_APP",
-            portnums_pb2.PortNum.AUDIO_APP: "AUDIO_APP",
-            portnums_pb2.PortNum.DETECTION_SENSOR_APP: "DETECTION_SENSOR_APP",
-            portnums_pb2.PortNum.REPLY_APP: "REPLY_APP",
-            portnums_pb2.PortNum.IP_TUNNEL_APP: "IP_TUNNEL_APP",
-            portnums_pb2.PortNum.PAXCOUNTER_APP: "PAXCOUNTER_APP",
-            portnums_pb2.PortNum.SERIAL_APP: "SERIAL_APP",
-            portnums_pb2.PortNum.STORE_FORWARD_APP: "STORE_FORWARD_APP",
-            portnums_pb2.PortNum.RANGE_TEST_APP: "RANGE_TEST_APP",
-            portnums_pb2.PortNum.TELEMETRY_APP: "TELEMETRY_APP",
-            portnums_pb2.PortNum.ZPS_APP: "ZPS_APP",
-            portnums_pb2.PortNum.SIMULATOR_APP: "SIMULATOR_APP",
-            portnums_pb2.PortNum.TRACEROUTE_APP: "TRACEROUTE_APP",
-            portnums_pb2.PortNum.NEIGHBORINFO_APP: "NEIGHBORINFO_APP",
-            portnums_pb2.PortNum.ATAK_PLUGIN: "ATAK_PLUGIN",
-            portnums_pb2.PortNum.PRIVATE_APP: "PRIVATE_APP",
-            portnums_pb2.PortNum.ATAK_FORWARDER: "ATAK_FORWARDER"
-        }
-        
-        port_name = port_names.get(portnum, f"UNKNOWN_PORT_{portnum}")
-        return f"{port_name} ({portnum})"
+        return f"{_PORT_NAMES.get(portnum, f'UNKNOWN_PORT_{portnum}')} ({portnum})"
     
     def decode_data_payload(self, data_msg):
         """Decode the Data protobuf message with detailed payload analysis"""
         interpretation = {}
         
-        # Port number
-        interpretation["Port"] = self.format_portnum(data_msg.portnum)
+        # Port number (read once; each protobuf field access goes through the message wrapper)
+        portnum = data_msg.portnum
+        interpretation[_KEY_PORT] = self.format_portnum(portnum)
         
         # Detailed payload decoding based on port type
         if data_msg.payload:
-            if data_msg.portnum == portnums_pb2.PortNum.TEXT_MESSAGE_APP:
-                try:
-                    text = data_msg.payload.decode('utf-8')
-                    interpretation["📱 Message Text"] = f'"{text}"'
-                except:
-                    interpretation["Payload Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()[:40]}{'...' if len(data_msg.payload) > 20 else ''}"
-                    
-            elif data_msg.portnum == portnums_pb2.PortNum.TRACEROUTE_APP:
-                try:
-                    route = mesh_pb2.RouteDiscovery()
-                    route.ParseFromString(data_msg.payload)
-                    
-                    # Handle forward route path
-                    if route.route:
-                        # Format route nodes with names if available
-                        if self.node_db_file:
-                            route_nodes = [self.format_node_with_name(self.format_node_id(node)) for node in route.route]
-                        else:
-                            route_nodes = [self.format_node_id(node) for node in route.route]
-                        
-                        # Embed SNR values with route nodes if available
-                        if route.snr_towards and len(route.snr_towards) >= len(route.route):
-                            # Pair each node with its SNR value
-                            route_with_snr = []
-                            for i, node in enumerate(route_nodes):
-                                if i < len(route.snr_towards):
-                                    snr_formatted = self.format_snr_value(route.snr_towards[i])
-                                    route_with_snr.append(f"{node} ({snr_formatted})")
-                                else:
-                                    route_with_snr.append(node)
-                            interpretation["📤 Trace Out"] = " → ".join(route_with_snr)
-                            
-                            # Show extra SNR values if any
-                            if len(route.snr_towards) > len(route.route):
-                                extra_snr = [self.format_snr_value(snr) for snr in route.snr_towards[len(route.route):]]
-                                interpretation["📶 Extra Forward SNR"] = " → ".join(extra_snr)
-                        else:
-                            interpretation["📤 Trace Out"] = " → ".join(route_nodes)
-                            if route.snr_towards:
-                                snr_values = [self.format_snr_value(snr) for snr in route.snr_towards]
-                                interpretation["📶 Forward SNR"] = " → ".join(snr_values)
-                        
-                        interpretation["📊 Forward Hops"] = f"{len(route.route)} nodes"
-                    
-                    # Handle return route path
-                    if route.route_back:
-                        # Format return route nodes with names if available
-                        if self.node_db_file:
-                            return_nodes = [self.format_node_with_name(self.format_node_id(node)) for node in route.route_back]
-                        else:
-                            return_nodes = [self.format_node_id(node) for node in route.route_back]
-                        
-                        # Embed SNR values with return route nodes if available
-                        if route.snr_back and len(route.snr_back) >= len(route.route_back):
-                            # Pair each return node with its SNR value
-                            return_with_snr = []
-                            for i, node in enumerate(return_nodes):
-                                if i < len(route.snr_back):
-                                    snr_formatted = self.format_snr_value(route.snr_back[i])
-                                    return_with_snr.append(f"{node} ({snr_formatted})")
-                                else:
-                                    return_with_snr.append(node)
-                            interpretation["📥 Trace Back"] = " → ".join(return_with_snr)
-                        else:
-                            interpretation["📥 Trace Back"] = " → ".join(return_nodes)
-                            if route.snr_back:
-                                snr_back_values = [self.format_snr_value(snr) for snr in route.snr_back]
-                                interpretation["📶 Return SNR"] = " → ".join(snr_back_values)
-                        
-                        interpretation["📊 Return Hops"] = f"{len(route.route_back)} nodes"
-                    
-                    # If we only have forward route but return SNR, show return SNR separately
-                    elif route.snr_back and not route.route_back:
-                        snr_back_values = [self.format_snr_value(snr) for snr in route.snr_back]
-                        interpretation["📶 Return SNR"] = " → ".join(snr_back_values)
-                    
-                    # Show debug info if arrays don't align
-                    if route.route and route.snr_towards and len(route.snr_towards) != len(route.route):
-                        interpretation["⚠️ Debug"] = f"Forward: {len(route.route)} nodes, {len(route.snr_towards)} SNR values"
-                    if route.route_back and route.snr_back and len(route.snr_back) != len(route.route_back):
-                        if "⚠️ Debug" in interpretation:
-                            interpretation["⚠️ Debug"] += f" | Return: {len(route.route_back)} nodes, {len(route.snr_back)} SNR values"
-                        else:
-                            interpretation["⚠️ Debug"] = f"Return: {len(route.route_back)} nodes, {len(route.snr_back)} SNR values"
-                        
-                except Exception as e:
-                    interpretation["Payload Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()[:40]}{'...' if len(data_msg.payload) > 20 else ''}"
-                    
-            elif data_msg.portnum == portnums_pb2.PortNum.POSITION_APP:
-                try:
-                    position = mesh_pb2.Position()
-                    position.ParseFromString(data_msg.payload)
-                    
-                    if position.latitude_i and position.longitude_i:
-                        lat = position.latitude_i * 1e-7
-                        lon = position.longitude_i * 1e-7
-                        interpretation["🌍 Location"] = f"{lat:.6f}, {lon:.6f}"
-                        interpretation["🗺️ Maps Link"] = f"https://maps.google.com/?q={lat},{lon}"
-                    
-                    if position.altitude:
-                        interpretation["⛰️ Altitude"] = f"{position.altitude}m"
-                        
-                    if position.ground_speed:
-                        interpretation["🏃 Speed"] = f"{position.ground_speed} km/h"
-                        
-                    if position.sats_in_view:
-                        interpretation["🛰️ Satellites"] = f"{position.sats_in_view}"
-                        
-                except Exception as e:
-                    # Try manual decoding
-                    try:
-                        if len(data_msg.payload) >= 8:
-                            lat_i = struct.unpack('<i', data_msg.payload[0:4])[0]
-                            lon_i = struct.unpack('<i', data_msg.payload[4:8])[0]
-                            
-                            if lat_i != 0 and lon_i != 0:
-                                lat = lat_i * 1e-7
-                                lon = lon_i * 1e-7
-                                interpretation["🌍 Location"] = f"{lat:.6f}, {lon:.6f}"
-                                interpretation["🗺️ Maps Link"] = f"https://maps.google.com/?q={lat},{lon}"
-                    except:
-                        pass
-                    interpretation["Payload Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()[:40]}{'...' if len(data_msg.payload) > 20 else ''}"
-                    
-            elif data_msg.portnum == portnums_pb2.PortNum.NODEINFO_APP:
-                try:
-                    user = mesh_pb2.User()
-                    user.ParseFromString(data_msg.payload)
-                    
-                    interpretation["📛 Node ID"] = user.id
-                    interpretation["📝 Long Name"] = user.long_name
-                    interpretation["🏷️ Short Name"] = user.short_name
-                    
-                    if user.macaddr:
-                        mac = ':'.join(f'{b:02x}' for b in user.macaddr)
-                        interpretation["🔗 MAC Address"] = mac
-                        
-                    if user.hw_model:
-                        interpretation["💻 Hardware"] = self.format_hardware_model(user.hw_model)
-                    
-                    # Update node database if enabled
-                    if self.node_db_file:
-                        node_data = {
-                            'long_name': user.long_name,
-                            'short_name': user.short_name,
-                        }
-                        if user.macaddr:
-                            node_data['mac'] = ':'.join(f'{b:02x}' for b in user.macaddr)
-                        if user.hw_model:
-                            node_data['hardware'] = self.format_hardware_model(user.hw_model)
-                        
-                        self.update_node_info(user.id, node_data, update_db_file=True)
-                        
-                except Exception as e:
-                    interpretation["Payload Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()[:40]}{'...' if len(data_msg.payload) > 20 else ''}"
-                    
-            elif data_msg.portnum == portnums_pb2.PortNum.TELEMETRY_APP:
-                # Proper telemetry decoding using protobuf definitions
-                try:
-                    telemetry = telemetry_pb2.Telemetry()
-                    telemetry.ParseFromString(data_msg.payload)
-                    
-                    # Check which telemetry variant is present
-                    variant = telemetry.WhichOneof('variant')
-                    
-                    if variant == 'device_metrics':
-                        device_metrics = telemetry.device_metrics
-                        
-                        # Battery level (percentage)
-                        if hasattr(device_metrics, 'battery_level') and device_metrics.battery_level > 0:
-                            interpretation["🔋 Battery"] = f"{device_metrics.battery_level}%"
-                        
-                        # Voltage
-                        if hasattr(device_metrics, 'voltage') and device_metrics.voltage > 0:
-                            interpretation["⚡ Voltage"] = f"{device_metrics.voltage:.2f}V"
-                        
-                        # Channel utilization
-                        if hasattr(device_metrics, 'channel_utilization') and device_metrics.channel_utilization > 0:
-                            interpretation["📡 Channel Util"] = f"{device_metrics.channel_utilization:.1f}%"
-                        
-                        # Air utilization TX
-                        if hasattr(device_metrics, 'air_util_tx') and device_metrics.air_util_tx > 0:
-                            interpretation["📶 Air Util TX"] = f"{device_metrics.air_util_tx:.1f}%"
-                        
-                        # Uptime
-                        if hasattr(device_metrics, 'uptime_seconds') and device_metrics.uptime_seconds > 0:
-                            uptime_hours = device_metrics.uptime_seconds / 3600
-                            if uptime_hours < 24:
-                                interpretation["⏱️ Uptime"] = f"{uptime_hours:.1f} hours"
-                            else:
-                                uptime_days = uptime_hours / 24
-                                interpretation["⏱️ Uptime"] = f"{uptime_days:.1f} days"
-                    
-                    elif variant == 'environment_metrics':
-                        env_metrics = telemetry.environment_metrics
-                        
-                        # Temperature
-                        if hasattr(env_metrics, 'temperature') and env_metrics.temperature != 0:
-                            interpretation["🌡️ Temperature"] = f"{env_metrics.temperature:.1f}°C"
-                        
-                        # Relative humidity
-                        if hasattr(env_metrics, 'relative_humidity') and env_metrics.relative_humidity > 0:
-                            interpretation["💧 Humidity"] = f"{env_metrics.relative_humidity:.1f}%"
-                        
-                        # Barometric pressure
-                        if hasattr(env_metrics, 'barometric_pressure') and env_metrics.barometric_pressure > 0:
-                            interpretation["🌪️ Pressure"] = f"{env_metrics.barometric_pressure:.1f} hPa"
-                        
-                        # Gas resistance (air quality)
-                        if hasattr(env_metrics, 'gas_resistance') and env_metrics.gas_resistance > 0:
-                            interpretation["🌬️ Gas Resistance"] = f"{env_metrics.gas_resistance:.0f} Ω"
-                        
-                        # Voltage (some environmental sensors report this)
-                        if hasattr(env_metrics, 'voltage') and env_metrics.voltage > 0:
-                            interpretation["⚡ Voltage"] = f"{env_metrics.voltage:.2f}V"
-                    
-                    elif variant == 'air_quality_metrics':
-                        air_metrics = telemetry.air_quality_metrics
-                        
-                        # PM1.0
-                        if hasattr(air_metrics, 'pm10_standard') and air_metrics.pm10_standard > 0:
-                            interpretation["🌫️ PM1.0"] = f"{air_metrics.pm10_standard} μg/m³"
-                        
-                        # PM2.5
-                        if hasattr(air_metrics, 'pm25_standard') and air_metrics.pm25_standard > 0:
-                            interpretation["🌫️ PM2.5"] = f"{air_metrics.pm25_standard} μg/m³"
-                        
-                        # PM10
-                        if hasattr(air_metrics, 'pm100_standard') and air_metrics.pm100_standard > 0:
-                            interpretation["🌫️ PM10"] = f"{air_metrics.pm100_standard} μg/m³"
-                    
-                    elif variant == 'power_metrics':
-                        power_metrics = telemetry.power_metrics
-                        
-                        # Voltage
-                        if hasattr(power_metrics, 'ch1_voltage') and power_metrics.ch1_voltage > 0:
-                            interpretation["⚡ CH1 Voltage"] = f"{power_metrics.ch1_voltage:.2f}V"
-                        
-                        # Current
-                        if hasattr(power_metrics, 'ch1_current') and power_metrics.ch1_current > 0:
-                            interpretation["🔌 CH1 Current"] = f"{power_metrics.ch1_current:.2f}A"
-                        
-                        # Additional channels if present
-                        if hasattr(power_metrics, 'ch2_voltage') and power_metrics.ch2_voltage > 0:
-                            interpretation["⚡ CH2 Voltage"] = f"{power_metrics.ch2_voltage:.2f}V"
-                        
-                        if hasattr(power_metrics, 'ch2_current') and power_metrics.ch2_current > 0:
-                            interpretation["🔌 CH2 Current"] = f"{power_metrics.ch2_current:.2f}A"
-                    
-                    # Add timestamp if available
-                    if hasattr(telemetry, 'time') and telemetry.time > 0:
-                        interpretation["🕐 Telemetry Time"] = self.format_timestamp(telemetry.time)
-                    
-                    # Add size info
-                    interpretation["📊 Telemetry Size"] = f"{len(data_msg.payload)} bytes"
-                    
-                except Exception as e:
-                    # Fallback to manual decoding if protobuf parsing fails
-                    try:
-                        if len(data_msg.payload) >= 4:
-                            # Try to extract voltage (common first field)
-                            voltage = struct.unpack('<f', data_msg.payload[0:4])[0]
-                            if 0 < voltage < 10:  # Reasonable voltage range
-                                interpretation["⚡ Voltage"] = f"{voltage:.2f}V"
-                                
-                        if len(data_msg.payload) >= 8:
-                            # Try to extract temperature
-                            temp = struct.unpack('<f', data_msg.payload[4:8])[0]
-                            if -50 < temp < 100:  # Reasonable temperature range
-                                interpretation["🌡️ Temperature"] = f"{temp:.1f}°C"
-                                
-                        interpretation["📊 Telemetry Size"] = f"{len(data_msg.payload)} bytes"
-                        interpretation["⚠️ Parse Status"] = f"Protobuf parsing failed: {e}"
-                        
-                    except Exception as e2:
-                        interpretation["Payload Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()[:40]}{'...' if len(data_msg.payload) > 20 else ''}"
-                        interpretation["⚠️ Parse Error"] = f"Both protobuf and manual parsing failed"
-                    
-            elif data_msg.portnum == portnums_pb2.PortNum.ROUTING_APP:
-                try:
-                    # Try to parse as routing message
-                    routing = mesh_pb2.Routing()
-                    routing.ParseFromString(data_msg.payload)
-                    
-                    variant = routing.WhichOneof('variant')
-                    if variant == 'route_request':
-                        interpretation["🔄 Routing Type"] = "Route Request (Traceroute)"
-                    elif variant == 'route_reply':
-                        interpretation["🔄 Routing Type"] = "Route Reply (Traceroute Response)"
-                    elif variant == 'error_reason':
-                        error_names = {
-                            0: "NONE (Success/ACK)",
-                            1: "NO_ROUTE", 
-                            2: "GOT_NAK",
-                            3: "TIMEOUT",
-                            4: "NO_INTERFACE",
-                            5: "MAX_RETRANSMIT",
-                            6: "NO_CHANNEL",
-                            7: "TOO_LARGE",
-                            8: "NO_RESPONSE",
-                            9: "DUTY_CYCLE_LIMIT"
-                        }
-                        error_code = routing.error_reason
-                        error_name = error_names.get(error_code, f"UNKNOWN_ERROR_{error_code}")
-                        interpretation["🔄 Routing Type"] = f"Status: {error_name}"
-                        if error_code == 0:
-                            interpretation["✅ Status"] = "Success/ACK"
-                    else:
-                        # Check if this is just a simple ACK (no variant set)
-                        if len(data_msg.payload) <= 4:
-                            interpretation["🔄 Routing Message"] = "Simple ACK packet"
-                        else:
-                            interpretation["🔄 Routing Message"] = "Control message"
-                        
-                    interpretation["📦 Routing Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()}"
-                    
-                except Exception as e:
-                    # This is likely a simple ACK or control message that doesn't parse as Routing protobuf
-                    if len(data_msg.payload) <= 4:
-                        interpretation["🔄 Routing Message"] = "Simple ACK packet"
-                        interpretation["✅ Status"] = "Message acknowledged"
-                    else:
-                        interpretation["🔄 Routing Message"] = "Control packet"
-                    interpretation["📦 Routing Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()}"
-                    
+            decoder = self._port_decoders.get(portnum)
+            if decoder:
+                decoder(data_msg, interpretation)
             else:
-                interpretation["Payload Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()[:40]}{'...' if len(data_msg.payload) > 20 else ''}"
+                interpretation[_KEY_PAYLOAD_DATA] = _hex_preview(data_msg.payload)
         
         # Other fields
         if data_msg.want_response:
@@ -943,6 +748,320 @@ class MeshtasticUDPDecoder:
         
         return interpretation
     
+    def _decode_text_message(self, data_msg, interpretation):
+        """Decode a text message payload"""
+        try:
+            text = data_msg.payload.decode('utf-8')
+            interpretation["📱 Message Text"] = f'"{text}"'
+        except UnicodeDecodeError:
+            interpretation[_KEY_PAYLOAD_DATA] = _hex_preview(data_msg.payload)
+    
+    def _decode_traceroute(self, data_msg, interpretation):
+        """Decode a traceroute RouteDiscovery payload"""
+        try:
+            route = mesh_pb2.RouteDiscovery()
+            route.ParseFromString(data_msg.payload)
+            
+            # Handle forward route path
+            if route.route:
+                # Format route nodes with names if available
+                if self.node_db_file:
+                    route_nodes = [self.format_node_with_name(_format_node_id(node)) for node in route.route]
+                else:
+                    route_nodes = list(map(_format_node_id, route.route))
+                
+                # Embed SNR values with route nodes if available
+                if route.snr_towards and len(route.snr_towards) >= len(route.route):
+                    # Pair each node with its SNR value
+                    route_with_snr = []
+                    for i, node in enumerate(route_nodes):
+                        if i < len(route.snr_towards):
+                            snr_formatted = _format_snr_value(route.snr_towards[i])
+                            route_with_snr.append(f"{node} ({snr_formatted})")
+                        else:
+                            route_with_snr.append(node)
+                    interpretation["📤 Trace Out"] = " → ".join(route_with_snr)
+                    
+                    # Show extra SNR values if any
+                    if len(route.snr_towards) > len(route.route):
+                        extra_snr = route.snr_towards[len(route.route):]
+                        interpretation["📶 Extra Forward SNR"] = " → ".join(map(_format_snr_value, extra_snr))
+                else:
+                    interpretation["📤 Trace Out"] = " → ".join(route_nodes)
+                    if route.snr_towards:
+                        interpretation["📶 Forward SNR"] = " → ".join(map(_format_snr_value, route.snr_towards))
+                
+                interpretation["📊 Forward Hops"] = f"{len(route.route)} nodes"
+            
+            # Handle return route path
+            if route.route_back:
+                # Format return route nodes with names if available
+                if self.node_db_file:
+                    return_nodes = [self.format_node_with_name(_format_node_id(node)) for node in route.route_back]
+                else:
+                    return_nodes = list(map(_format_node_id, route.route_back))
+                
+                # Embed SNR values with return route nodes if available
+                if route.snr_back and len(route.snr_back) >= len(route.route_back):
+                    # Pair each return node with its SNR value
+                    return_with_snr = []
+                    for i, node in enumerate(return_nodes):
+                        if i < len(route.snr_back):
+                            snr_formatted = _format_snr_value(route.snr_back[i])
+                            return_with_snr.append(f"{node} ({snr_formatted})")
+                        else:
+                            return_with_snr.append(node)
+                    interpretation["📥 Trace Back"] = " → ".join(return_with_snr)
+                else:
+                    interpretation["📥 Trace Back"] = " → ".join(return_nodes)
+                    if route.snr_back:
+                        interpretation["📶 Return SNR"] = " → ".join(map(_format_snr_value, route.snr_back))
+                
+                interpretation["📊 Return Hops"] = f"{len(route.route_back)} nodes"
+            
+            # If we only have forward route but return SNR, show return SNR separately
+            elif route.snr_back and not route.route_back:
+                interpretation["📶 Return SNR"] = " → ".join(map(_format_snr_value, route.snr_back))
+            
+            # Show debug info if arrays don't align
+            if route.route and route.snr_towards and len(route.snr_towards) != len(route.route):
+                interpretation[_KEY_DEBUG] = f"Forward: {len(route.route)} nodes, {len(route.snr_towards)} SNR values"
+            if route.route_back and route.snr_back and len(route.snr_back) != len(route.route_back):
+                if _KEY_DEBUG in interpretation:
+                    interpretation[_KEY_DEBUG] += f" | Return: {len(route.route_back)} nodes, {len(route.snr_back)} SNR values"
+                else:
+                    interpretation[_KEY_DEBUG] = f"Return: {len(route.route_back)} nodes, {len(route.snr_back)} SNR values"
+                
+        except Exception as e:
+            interpretation[_KEY_PAYLOAD_DATA] = _hex_preview(data_msg.payload)
+    
+    def _decode_position(self, data_msg, interpretation):
+        """Decode a Position payload"""
+        try:
+            position = mesh_pb2.Position()
+            position.ParseFromString(data_msg.payload)
+            
+            if position.latitude_i and position.longitude_i:
+                lat = position.latitude_i * 1e-7
+                lon = position.longitude_i * 1e-7
+                interpretation["🌍 Location"] = f"{lat:.6f}, {lon:.6f}"
+                interpretation["🗺️ Maps Link"] = f"https://maps.google.com/?q={lat},{lon}"
+            
+            if position.altitude:
+                interpretation["⛰️ Altitude"] = f"{position.altitude}m"
+                
+            if position.ground_speed:
+                interpretation["🏃 Speed"] = f"{position.ground_speed} km/h"
+                
+            if position.sats_in_view:
+                interpretation["🛰️ Satellites"] = f"{position.sats_in_view}"
+                
+        except Exception as e:
+            # Try manual decoding
+            try:
+                if len(data_msg.payload) >= 8:
+                    lat_i, lon_i = _POSITION_FALLBACK.unpack_from(data_msg.payload)
+                    
+                    if lat_i != 0 and lon_i != 0:
+                        lat = lat_i * 1e-7
+                        lon = lon_i * 1e-7
+                        interpretation["🌍 Location"] = f"{lat:.6f}, {lon:.6f}"
+                        interpretation["🗺️ Maps Link"] = f"https://maps.google.com/?q={lat},{lon}"
+            except struct.error:
+                pass
+            interpretation[_KEY_PAYLOAD_DATA] = _hex_preview(data_msg.payload)
+    
+    def _decode_nodeinfo(self, data_msg, interpretation):
+        """Decode a User payload and update the node database"""
+        try:
+            user = mesh_pb2.User()
+            user.ParseFromString(data_msg.payload)
+            
+            interpretation["📛 Node ID"] = user.id
+            interpretation["📝 Long Name"] = user.long_name
+            interpretation["🏷️ Short Name"] = user.short_name
+            
+            if user.macaddr:
+                mac = ':'.join(f'{b:02x}' for b in user.macaddr)
+                interpretation["🔗 MAC Address"] = mac
+                
+            if user.hw_model:
+                interpretation["💻 Hardware"] = self.format_hardware_model(user.hw_model)
+            
+            # Update node database if enabled
+            if self.node_db_file:
+                node_data = {
+                    'long_name': user.long_name,
+                    'short_name': user.short_name,
+                }
+                if user.macaddr:
+                    node_data['mac'] = ':'.join(f'{b:02x}' for b in user.macaddr)
+                if user.hw_model:
+                    node_data['hardware'] = self.format_hardware_model(user.hw_model)
+                
+                self.update_node_info(user.id, node_data, update_db_file=True)
+                
+        except Exception as e:
+            interpretation[_KEY_PAYLOAD_DATA] = _hex_preview(data_msg.payload)
+    
+    def _decode_telemetry(self, data_msg, interpretation):
+        """Decode a Telemetry payload"""
+        # Proper telemetry decoding using protobuf definitions
+        try:
+            telemetry = self._telemetry
+            telemetry.ParseFromString(data_msg.payload)
+            
+            # Check which telemetry variant is present
+            variant = telemetry.WhichOneof('variant')
+            
+            if variant == 'device_metrics':
+                device_metrics = telemetry.device_metrics
+                
+                # Battery level (percentage)
+                if device_metrics.battery_level > 0:
+                    interpretation["🔋 Battery"] = f"{device_metrics.battery_level}%"
+                
+                # Voltage
+                if device_metrics.voltage > 0:
+                    interpretation["⚡ Voltage"] = f"{device_metrics.voltage:.2f}V"
+                
+                # Channel utilization
+                if device_metrics.channel_utilization > 0:
+                    interpretation["📡 Channel Util"] = f"{device_metrics.channel_utilization:.1f}%"
+                
+                # Air utilization TX
+                if device_metrics.air_util_tx > 0:
+                    interpretation["📶 Air Util TX"] = f"{device_metrics.air_util_tx:.1f}%"
+                
+                # Uptime
+                if device_metrics.uptime_seconds > 0:
+                    uptime_hours = device_metrics.uptime_seconds / 3600
+                    if uptime_hours < 24:
+                        interpretation["⏱️ Uptime"] = f"{uptime_hours:.1f} hours"
+                    else:
+                        uptime_days = uptime_hours / 24
+                        interpretation["⏱️ Uptime"] = f"{uptime_days:.1f} days"
+            
+            elif variant == 'environment_metrics':
+                env_metrics = telemetry.environment_metrics
+                
+                # Temperature
+                if env_metrics.temperature != 0:
+                    interpretation["🌡️ Temperature"] = f"{env_metrics.temperature:.1f}°C"
+                
+                # Relative humidity
+                if env_metrics.relative_humidity > 0:
+                    interpretation["💧 Humidity"] = f"{env_metrics.relative_humidity:.1f}%"
+                
+                # Barometric pressure
+                if env_metrics.barometric_pressure > 0:
+                    interpretation["🌪️ Pressure"] = f"{env_metrics.barometric_pressure:.1f} hPa"
+                
+                # Gas resistance (air quality)
+                if env_metrics.gas_resistance > 0:
+                    interpretation["🌬️ Gas Resistance"] = f"{env_metrics.gas_resistance:.0f} Ω"
+                
+                # Voltage (some environmental sensors report this)
+                if env_metrics.voltage > 0:
+                    interpretation["⚡ Voltage"] = f"{env_metrics.voltage:.2f}V"
+            
+            elif variant == 'air_quality_metrics':
+                air_metrics = telemetry.air_quality_metrics
+                
+                # PM1.0
+                if air_metrics.pm10_standard > 0:
+                    interpretation["🌫️ PM1.0"] = f"{air_metrics.pm10_standard} μg/m³"
+                
+                # PM2.5
+                if air_metrics.pm25_standard > 0:
+                    interpretation["🌫️ PM2.5"] = f"{air_metrics.pm25_standard} μg/m³"
+                
+                # PM10
+                if air_metrics.pm100_standard > 0:
+                    interpretation["🌫️ PM10"] = f"{air_metrics.pm100_standard} μg/m³"
+            
+            elif variant == 'power_metrics':
+                power_metrics = telemetry.power_metrics
+                
+                # Voltage
+                if power_metrics.ch1_voltage > 0:
+                    interpretation["⚡ CH1 Voltage"] = f"{power_metrics.ch1_voltage:.2f}V"
+                
+                # Current
+                if power_metrics.ch1_current > 0:
+                    interpretation["🔌 CH1 Current"] = f"{power_metrics.ch1_current:.2f}A"
+                
+                # Additional channels if present
+                if power_metrics.ch2_voltage > 0:
+                    interpretation["⚡ CH2 Voltage"] = f"{power_metrics.ch2_voltage:.2f}V"
+                
+                if power_metrics.ch2_current > 0:
+                    interpretation["🔌 CH2 Current"] = f"{power_metrics.ch2_current:.2f}A"
+            
+            # Add timestamp if available
+            if telemetry.time > 0:
+                interpretation["🕐 Telemetry Time"] = self.format_timestamp(telemetry.time)
+            
+            # Add size info
+            interpretation["📊 Telemetry Size"] = f"{len(data_msg.payload)} bytes"
+            
+        except Exception as e:
+            # Fallback to manual decoding: voltage (common first field) and temperature in one unpack
+            if len(data_msg.payload) >= 8:
+                voltage, temp = _TELEMETRY_FALLBACK.unpack_from(data_msg.payload)
+            elif len(data_msg.payload) >= 4:
+                voltage, = _VOLTAGE_FALLBACK.unpack_from(data_msg.payload)
+                temp = None
+            else:
+                voltage = temp = None
+            
+            if voltage is not None and 0 < voltage < 10:  # Reasonable voltage range
+                interpretation["⚡ Voltage"] = f"{voltage:.2f}V"
+            
+            if temp is not None and -50 < temp < 100:  # Reasonable temperature range
+                interpretation["🌡️ Temperature"] = f"{temp:.1f}°C"
+            
+            interpretation["📊 Telemetry Size"] = f"{len(data_msg.payload)} bytes"
+            interpretation["⚠️ Parse Status"] = f"Protobuf parsing failed: {e}"
+    
+    def _decode_routing_app(self, data_msg, interpretation):
+        """Decode a Routing payload carried in a Data message"""
+        try:
+            # Try to parse as routing message
+            routing = self._routing
+            routing.ParseFromString(data_msg.payload)
+            
+            variant = routing.WhichOneof('variant')
+            if variant == 'route_request':
+                interpretation["🔄 Routing Type"] = "Route Request (Traceroute)"
+            elif variant == 'route_reply':
+                interpretation["🔄 Routing Type"] = "Route Reply (Traceroute Response)"
+            elif variant == 'error_reason':
+                error_code = routing.error_reason
+                if error_code == 0:
+                    interpretation["🔄 Routing Type"] = "Status: NONE (Success/ACK)"
+                    interpretation["✅ Status"] = "Success/ACK"
+                else:
+                    error_name = _ROUTING_ERROR_NAMES.get(error_code, f"UNKNOWN_ERROR_{error_code}")
+                    interpretation["🔄 Routing Type"] = f"Status: {error_name}"
+            else:
+                # Check if this is just a simple ACK (no variant set)
+                if len(data_msg.payload) <= 4:
+                    interpretation["🔄 Routing Message"] = "Simple ACK packet"
+                else:
+                    interpretation["🔄 Routing Message"] = "Control message"
+                
+            interpretation["📦 Routing Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()}"
+            
+        except Exception as e:
+            # This is likely a simple ACK or control message that doesn't parse as Routing protobuf
+            if len(data_msg.payload) <= 4:
+                interpretation["🔄 Routing Message"] = "Simple ACK packet"
+                interpretation["✅ Status"] = "Message acknowledged"
+            else:
+                interpretation["🔄 Routing Message"] = "Control packet"
+            interpretation["📦 Routing Data"] = f"bytes({len(data_msg.payload)}): {data_msg.payload.hex()}"
+    
     def decode_routing_payload(self, routing_msg):
         """Decode the Routing protobuf message"""
         interpretation = {}
@@ -953,50 +1072,35 @@ class MeshtasticUDPDecoder:
         if variant == 'route_request':
             interpretation["Routing Type"] = "Route Request (Traceroute)"
             route_req = routing_msg.route_request
-            if hasattr(route_req, 'route') and route_req.route:
-                route_nodes = [self.format_node_id(node) for node in route_req.route]
+            if route_req.route:
+                route_nodes = list(map(_format_node_id, route_req.route))
                 interpretation["Route"] = " → ".join(route_nodes)
-            if hasattr(route_req, 'snr_towards') and route_req.snr_towards:
-                snr_values = [f"{snr/4:.1f}dB" for snr in route_req.snr_towards]  # SNR is scaled by 4
-                interpretation["SNR Values"] = " → ".join(snr_values)
+            if route_req.snr_towards:
+                interpretation["SNR Values"] = " → ".join(map(_format_snr_db, route_req.snr_towards))
                 
         elif variant == 'route_reply':
             interpretation["Routing Type"] = "Route Reply (Traceroute Response)"
             route_reply = routing_msg.route_reply
-            if hasattr(route_reply, 'route') and route_reply.route:
-                route_nodes = [self.format_node_id(node) for node in route_reply.route]
+            if route_reply.route:
+                route_nodes = list(map(_format_node_id, route_reply.route))
                 interpretation["Forward Route"] = " → ".join(route_nodes)
-            if hasattr(route_reply, 'route_back') and route_reply.route_back:
-                route_back_nodes = [self.format_node_id(node) for node in route_reply.route_back]
+            if route_reply.route_back:
+                route_back_nodes = list(map(_format_node_id, route_reply.route_back))
                 interpretation["Return Route"] = " → ".join(route_back_nodes)
-            if hasattr(route_reply, 'snr_towards') and route_reply.snr_towards:
-                snr_values = [f"{snr/4:.1f}dB" for snr in route_reply.snr_towards]
-                interpretation["Forward SNR"] = " → ".join(snr_values)
-            if hasattr(route_reply, 'snr_back') and route_reply.snr_back:
-                snr_back_values = [f"{snr/4:.1f}dB" for snr in route_reply.snr_back]
-                interpretation["Return SNR"] = " → ".join(snr_back_values)
+            if route_reply.snr_towards:
+                interpretation["Forward SNR"] = " → ".join(map(_format_snr_db, route_reply.snr_towards))
+            if route_reply.snr_back:
+                interpretation["Return SNR"] = " → ".join(map(_format_snr_db, route_reply.snr_back))
                 
         elif variant == 'error_reason':
-            error_names = {
-                0: "NONE",
-                1: "NO_ROUTE", 
-                2: "GOT_NAK",
-                3: "TIMEOUT",
-                4: "NO_INTERFACE",
-                5: "MAX_RETRANSMIT",
-                6: "NO_CHANNEL",
-                7: "TOO_LARGE",
-                8: "NO_RESPONSE",
-                9: "DUTY_CYCLE_LIMIT"
-            }
-            error_name = error_names.get(routing_msg.error_reason, f"UNKNOWN_ERROR_{routing_msg.error_reason}")
+            error_name = _ROUTING_ERROR_NAMES.get(routing_msg.error_reason, f"UNKNOWN_ERROR_{routing_msg.error_reason}")
             interpretation["Routing Type"] = f"Error: {error_name}"
         else:
             # Handle the case where it might be a RouteDiscovery message (like Android app expects)
             # Try to access route list directly if it's a RouteDiscovery
             if hasattr(routing_msg, 'route') and routing_msg.route:
                 interpretation["Routing Type"] = "Route Discovery (Traceroute Response)"
-                route_nodes = [self.format_node_id(node) for node in routing_msg.route]
+                route_nodes = list(map(_format_node_id, routing_msg.route))
                 interpretation["Route Path"] = " → ".join(route_nodes)
                 interpretation["Route Details"] = f"Path through {len(route_nodes)} nodes"
         
@@ -1004,23 +1108,30 @@ class MeshtasticUDPDecoder:
     
     def process_packet(self, data, addr, original_timestamp=None):
         """Process a received packet and choose output format based on verbose flag"""
+        if self.count_only:
+            # Statistics only: skip all decoding and output
+            self.packet_count += 1
+            self.total_bytes += len(data)
+            return
+        
         if self.verbose:
             # Use verbose output (existing detailed format)
             self.print_packet_verbose(data, addr, original_timestamp)
         else:
             # Use simple output - need to decode packet first
             try:
-                mesh_packet = mesh_pb2.MeshPacket()
+                mesh_packet = self._mesh_packet
                 mesh_packet.ParseFromString(data)
                 
                 decoded_info = None
                 
                 # Handle payload decoding
-                if mesh_packet.WhichOneof('payload_variant') == 'decoded':
+                payload_variant = mesh_packet.WhichOneof('payload_variant')
+                if payload_variant == 'decoded':
                     data_msg = mesh_packet.decoded
                     decoded_info = self.decode_data_payload(data_msg)
                     
-                elif mesh_packet.WhichOneof('payload_variant') == 'encrypted':
+                elif payload_variant == 'encrypted':
                     # Attempt decryption
                     encrypted_data = mesh_packet.encrypted
                     decrypted_data, status, data_msg = self.decrypt_payload(
@@ -1035,7 +1146,7 @@ class MeshtasticUDPDecoder:
                     else:
                         # Failed to decrypt - show basic info
                         decoded_info = {
-                            "Port": "ENCRYPTED",
+                            _KEY_PORT: "ENCRYPTED",
                             "🔒 Status": "Unable to decrypt"
                         }
                 
@@ -1050,17 +1161,19 @@ class MeshtasticUDPDecoder:
     def print_packet_simple(self, data, addr, mesh_packet, decoded_info, original_timestamp=None):
         """Print simplified packet information"""
         if original_timestamp:
-            timestamp = datetime.fromtimestamp(original_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            timestamp = _format_packet_time(original_timestamp)
         else:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            timestamp = _format_packet_time(time.time())
         
-        with self.stats_lock:
-            self.packet_count += 1
-            self.total_bytes += len(data)
-            packet_num = self.packet_count
+        self.packet_count += 1
+        self.total_bytes += len(data)
+        packet_num = self.packet_count
         
-        print(f"{'='*80}")
-        print(f"Packet #{packet_num} - {timestamp}")
+        # Collect the lines and write them in one go instead of one print per line
+        lines = []
+        out = lines.append
+        out(_SEPARATOR)
+        out(f"Packet #{packet_num} - {timestamp}")
         
         # Format the from/to line with node names if available
         from_node_id = self.format_node_id(getattr(mesh_packet, 'from'))
@@ -1072,7 +1185,7 @@ class MeshtasticUDPDecoder:
             to_node_id = self.format_node_id(mesh_packet.to)
             to_node = self.format_node_with_name(to_node_id) if self.node_db_file else to_node_id
         
-        print(f"From: {from_node} → To: {to_node}")
+        out(f"From: {from_node} → To: {to_node}")
         
         # Channel and hop info
         channel_info = f"Channel: {mesh_packet.channel}"
@@ -1095,121 +1208,116 @@ class MeshtasticUDPDecoder:
         
         # Combine channel, hops, and signal info
         info_parts = [part for part in [channel_info, hops_info, signal_info] if part]
-        print(" | ".join(info_parts))
+        out(" | ".join(info_parts))
         
         # Message content
         if decoded_info:
-            port_info = decoded_info.get("Port", "UNKNOWN")
+            port_info = decoded_info.get(_KEY_PORT, "UNKNOWN")
             port_name = port_info.split("(")[0].strip()  # Get just the name part
             
-            # Create a more readable port description
-            port_descriptions = {
-                "TEXT_MESSAGE_APP": "Text Message",
-                "NODEINFO_APP": "Node Information Update", 
-                "POSITION_APP": "Position Update",
-                "TELEMETRY_APP": "Telemetry Data",
-                "TRACEROUTE_APP": "Network Traceroute",
-                "ROUTING_APP": "Routing Control",
-                "ADMIN_APP": "Administration",
-                "NEIGHBORINFO_APP": "Neighbor Discovery"
-            }
-            
-            description = port_descriptions.get(port_name, port_name.replace("_", " ").title())
-            print(f"\n{port_name}: {description}")
+            description = _PORT_DESCRIPTIONS.get(port_name, port_name.replace("_", " ").title())
+            out(f"\n{port_name}: {description}")
             
             # Show key information based on message type
             for key, value in decoded_info.items():
-                if key != "Port":  # Skip the port since we already showed it
-                    print(f"  {key}: {value}")
+                if key != _KEY_PORT:  # Skip the port since we already showed it
+                    out(f"  {key}: {value}")
         
-        print()  # Empty line for separation
+        out("")  # Empty line for separation
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def print_packet_verbose(self, data, addr, original_timestamp=None):
         """Print detailed packet information with proper protobuf decoding"""
         if original_timestamp:
-            timestamp = datetime.fromtimestamp(original_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            timestamp = _format_packet_time(original_timestamp)
         else:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            timestamp = _format_packet_time(time.time())
         
-        with self.stats_lock:
-            self.packet_count += 1
-            self.total_bytes += len(data)
-            packet_num = self.packet_count
+        self.packet_count += 1
+        self.total_bytes += len(data)
+        packet_num = self.packet_count
         
-        print(f"{'='*80}")
-        print(f"Packet #{packet_num} - {timestamp}")
-        print(f"Source: {addr[0]}:{addr[1]}")
-        print(f"Size: {len(data)} bytes")
+        # Collect the lines and write them in one go instead of one print per line
+        lines = []
+        out = lines.append
+        out(_SEPARATOR)
+        out(f"Packet #{packet_num} - {timestamp}")
+        out(f"Source: {addr[0]}:{addr[1]}")
+        out(f"Size: {len(data)} bytes")
         
         # Try to decode as MeshPacket protobuf
         try:
-            mesh_packet = mesh_pb2.MeshPacket()
+            mesh_packet = self._mesh_packet
             mesh_packet.ParseFromString(data)
             
-            print(f"\nDECODED MESHPACKET:")
-            print(f"  From Node: {self.format_node_id(getattr(mesh_packet, 'from'))}")
+            # 'from' is a Python keyword, so the field can only be read with getattr
+            from_id = getattr(mesh_packet, 'from')
+            
+            out(f"\nDECODED MESHPACKET:")
+            out(f"  From Node: {self.format_node_id(from_id)}")
             
             if mesh_packet.to == 0xFFFFFFFF:
-                print(f"  To: Broadcast (all nodes)")
+                out(f"  To: Broadcast (all nodes)")
             else:
-                print(f"  To: {self.format_node_id(mesh_packet.to)}")
+                out(f"  To: {self.format_node_id(mesh_packet.to)}")
             
-            print(f"  Channel Hash: {mesh_packet.channel}")
-            print(f"  Packet ID: 0x{mesh_packet.id:08x}")
+            out(f"  Channel Hash: {mesh_packet.channel}")
+            out(f"  Packet ID: 0x{mesh_packet.id:08x}")
             
             if mesh_packet.rx_time:
-                print(f"  Received Time: {self.format_timestamp(mesh_packet.rx_time)}")
+                out(f"  Received Time: {self.format_timestamp(mesh_packet.rx_time)}")
             
             if mesh_packet.rx_snr:
-                print(f"  SNR: {self.format_rssi_snr(mesh_packet.rx_snr)}")
+                out(f"  SNR: {self.format_rssi_snr(mesh_packet.rx_snr)}")
             
             if mesh_packet.hop_limit:
-                print(f"  Hop Limit: {mesh_packet.hop_limit} hops remaining")
+                out(f"  Hop Limit: {mesh_packet.hop_limit} hops remaining")
             
             if mesh_packet.want_ack:
-                print(f"  Wants ACK: Yes")
+                out(f"  Wants ACK: Yes")
             
             if mesh_packet.priority:
-                print(f"  Priority: {self.format_priority(mesh_packet.priority)}")
+                out(f"  Priority: {self.format_priority(mesh_packet.priority)}")
             
             if mesh_packet.rx_rssi:
-                print(f"  RSSI: {self.format_rssi(mesh_packet.rx_rssi)}")
+                out(f"  RSSI: {self.format_rssi(mesh_packet.rx_rssi)}")
             
             if mesh_packet.hop_start:
-                print(f"  Started with: {mesh_packet.hop_start} hops")
+                out(f"  Started with: {mesh_packet.hop_start} hops")
             
             # Handle payload
-            if mesh_packet.WhichOneof('payload_variant') == 'decoded':
-                print(f"\n  DECODED PAYLOAD:")
+            payload_variant = mesh_packet.WhichOneof('payload_variant')
+            if payload_variant == 'decoded':
+                out(f"\n  DECODED PAYLOAD:")
                 data_msg = mesh_packet.decoded
                 decoded_info = self.decode_data_payload(data_msg)
                 for desc, value in decoded_info.items():
-                    print(f"    {desc}: {value}")
+                    out(f"    {desc}: {value}")
                     
-            elif mesh_packet.WhichOneof('payload_variant') == 'encrypted':
-                print(f"\n  ENCRYPTED PAYLOAD:")
+            elif payload_variant == 'encrypted':
+                out(f"\n  ENCRYPTED PAYLOAD:")
                 encrypted_data = mesh_packet.encrypted
-                print(f"    Size: {len(encrypted_data)} bytes")
-                print(f"    Data: {encrypted_data.hex()[:40]}{'...' if len(encrypted_data) > 20 else ''}")
+                out(f"    Size: {len(encrypted_data)} bytes")
+                out(f"    Data: {encrypted_data[:20].hex()}{'...' if len(encrypted_data) > 20 else ''}")
                 
                 # Attempt decryption
                 decrypted_data, status, data_msg = self.decrypt_payload(
-                    encrypted_data, mesh_packet.id, getattr(mesh_packet, 'from'), mesh_packet.channel)
+                    encrypted_data, mesh_packet.id, from_id, mesh_packet.channel)
                 
-                print(f"\n  DECRYPTION ATTEMPT:")
-                print(f"    Status: {status}")
+                out(f"\n  DECRYPTION ATTEMPT:")
+                out(f"    Status: {status}")
                 
                 # Add debugging info for failed decryption
                 if not decrypted_data:
-                    print(f"    Debug: Packet ID=0x{mesh_packet.id:08x}, From=0x{getattr(mesh_packet, 'from'):08x}")
-                    print(f"    Debug: Channel Hash={mesh_packet.channel}, Payload Size={len(encrypted_data)}")
-                    print(f"    Debug: First few bytes of encrypted data: {encrypted_data[:8].hex()}")
+                    out(f"    Debug: Packet ID=0x{mesh_packet.id:08x}, From=0x{from_id:08x}")
+                    out(f"    Debug: Channel Hash={mesh_packet.channel}, Payload Size={len(encrypted_data)}")
+                    out(f"    Debug: First few bytes of encrypted data: {encrypted_data[:8].hex()}")
                 
                 if decrypted_data and data_msg:
-                    print(f"    Decrypted Data ({len(decrypted_data)} bytes):")
-                    print(self.format_hex_dump(decrypted_data, 16))
+                    out(f"    Decrypted Data ({len(decrypted_data)} bytes):")
+                    out(self.format_hex_dump(decrypted_data, 16, self.verbose_hex_max_bytes))
                     
-                    print(f"    Decoded Message:")
+                    out(f"    Decoded Message:")
                     # Check if it's a Data or Routing message
                     if hasattr(data_msg, 'portnum'):  # It's a Data message
                         decoded_info = self.decode_data_payload(data_msg)
@@ -1217,16 +1325,15 @@ class MeshtasticUDPDecoder:
                         decoded_info = self.decode_routing_payload(data_msg)
                     
                     for desc, value in decoded_info.items():
-                        print(f"      {desc}: {value}")
+                        out(f"      {desc}: {value}")
                         
         except Exception as e:
-            print(f"\nError parsing MeshPacket: {e}")
-            print("Raw packet data:")
-            print(self.format_hex_dump(data))
+            out(f"\nError parsing MeshPacket: {e}")
         
-        print(f"\nRAW PACKET DATA:")
-        print(self.format_hex_dump(data))
-        print()
+        out(f"\nRAW PACKET DATA:")
+        out(self.format_hex_dump(data, limit=self.verbose_hex_max_bytes))
+        out("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def print_statistics(self):
         """Print monitoring statistics"""
@@ -1237,17 +1344,16 @@ class MeshtasticUDPDecoder:
         if elapsed == 0:
             return
             
-        with self.stats_lock:
-            packets_per_sec = self.packet_count / elapsed
-            bytes_per_sec = self.total_bytes / elapsed
+        packets_per_sec = self.packet_count / elapsed
+        bytes_per_sec = self.total_bytes / elapsed
             
-        print(f"\n{'='*80}")
+        print(f"\n{_SEPARATOR}")
         print(f"STATISTICS")
         print(f"Runtime: {elapsed:.1f} seconds")
         print(f"Total packets: {self.packet_count}")
         print(f"Total bytes: {self.total_bytes}")
         print(f"Rate: {packets_per_sec:.2f} packets/sec, {bytes_per_sec:.1f} bytes/sec")
-        print(f"{'='*80}")
+        print(_SEPARATOR)
     
     def signal_handler(self, signum, frame):
         """Handle Ctrl+C gracefully"""
@@ -1258,49 +1364,77 @@ class MeshtasticUDPDecoder:
         self.print_statistics()
         sys.exit(0)
     
+    def _replay_lines(self, lines):
+        """Decode and process each timestamp<TAB>hex line of a capture stream"""
+        process_packet = self.process_packet
+        unhexlify = binascii.unhexlify  # no whitespace skipping, so cheaper than bytes.fromhex
+        fake_addr = ('127.0.0.1', 4403)
+        
+        # Problems are summarized at the end rather than printed one by one. Malformed lines
+        # are faults in the capture; processing errors are faults in the decoder.
+        bad_count = 0
+        bad_lines = []  # first _REPLAY_WARNING_LIMIT (line_num, problem) pairs
+        error_count = 0
+        error_lines = []
+        
+        try:
+            for line_num, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # Parse TSV format: timestamp<TAB>hex_data
+                timestamp_str, sep, hex_data = line.partition('\t')
+                if not sep or '\t' in hex_data:
+                    problem = f"Invalid line format: {line[:50]}..."
+                else:
+                    try:
+                        original_timestamp = float(timestamp_str)
+                    except ValueError as e:
+                        original_timestamp = None
+                        problem = f"Invalid timestamp: {e}"
+                    
+                    if original_timestamp is not None:
+                        try:
+                            packet_data = unhexlify(hex_data)
+                        except ValueError as e:
+                            problem = f"Invalid hex data: {e}"
+                        else:
+                            # Process the packet with its original timestamp
+                            try:
+                                process_packet(packet_data, fake_addr, original_timestamp)
+                            except Exception as e:
+                                error_count += 1
+                                if len(error_lines) < _REPLAY_WARNING_LIMIT:
+                                    error_lines.append((line_num, f"{type(e).__name__}: {e}"))
+                            continue
+                
+                bad_count += 1
+                if len(bad_lines) < _REPLAY_WARNING_LIMIT:
+                    bad_lines.append((line_num, problem))
+        finally:
+            if bad_count:
+                self._print_replay_problems(
+                    f"skipped {bad_count} malformed line{'s' if bad_count != 1 else ''}", bad_count, bad_lines)
+            if error_count:
+                self._print_replay_problems(
+                    f"error processing {error_count} packet{'s' if error_count != 1 else ''}", error_count, error_lines)
+    
+    def _print_replay_problems(self, summary, count, samples):
+        """Print a replay warning summary with the first few (line_num, problem) samples"""
+        print(f"Warning: {summary}")
+        for line_num, problem in samples:
+            print(f"  line {line_num}: {problem}")
+        if count > len(samples):
+            print(f"  ... and {count - len(samples)} more")
+    
     def replay_file(self, filename, update_db=False):
         """Replay packets from a single TSV file"""
         print(f"Replaying packets from: {filename}")
         
         try:
             with open(filename, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    try:
-                        # Parse TSV format: timestamp<TAB>hex_data
-                        parts = line.split('\t')
-                        if len(parts) != 2:
-                            print(f"Warning: Invalid line format at line {line_num}: {line[:50]}...")
-                            continue
-                            
-                        timestamp_str, hex_data = parts
-                        original_timestamp = float(timestamp_str)
-                        
-                        # Convert hex back to bytes
-                        packet_data = bytes.fromhex(hex_data)
-                        
-                        # Create fake address for replay
-                        fake_addr = ('127.0.0.1', 4403)
-                        
-                        # Process the packet with original timestamp
-                        # For replay with update_db, temporarily disable file updates during processing
-                        if update_db:
-                            # Store original update setting and disable file updates during replay
-                            original_update_setting = True
-                            # Process packet but don't update file immediately
-                            self.process_packet(packet_data, fake_addr, original_timestamp)
-                        else:
-                            self.process_packet(packet_data, fake_addr, original_timestamp)
-                        
-                    except ValueError as e:
-                        print(f"Warning: Invalid hex data at line {line_num}: {e}")
-                        continue
-                    except Exception as e:
-                        print(f"Warning: Error processing line {line_num}: {e}")
-                        continue
+                self._replay_lines(f)
             
             # Save the complete database at the end if updating
             if update_db and self.node_db_file:
@@ -1340,37 +1474,8 @@ class MeshtasticUDPDecoder:
         print("Reading packets from stdin...")
         
         try:
-            for line_num, line in enumerate(sys.stdin, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                try:
-                    # Parse TSV format: timestamp<TAB>hex_data
-                    parts = line.split('\t')
-                    if len(parts) != 2:
-                        print(f"Warning: Invalid line format at line {line_num}: {line[:50]}...")
-                        continue
-                        
-                    timestamp_str, hex_data = parts
-                    original_timestamp = float(timestamp_str)
-                    
-                    # Convert hex back to bytes
-                    packet_data = bytes.fromhex(hex_data)
-                    
-                    # Create fake address for replay
-                    fake_addr = ('127.0.0.1', 4403)
-                    
-                    # Process the packet with original timestamp
-                    self.process_packet(packet_data, fake_addr, original_timestamp)
-                    
-                except ValueError as e:
-                    print(f"Warning: Invalid hex data at line {line_num}: {e}")
-                    continue
-                except Exception as e:
-                    print(f"Warning: Error processing line {line_num}: {e}")
-                    continue
-                    
+            self._replay_lines(sys.stdin)
+            
         except KeyboardInterrupt:
             print("\nReplay interrupted by user")
         except Exception as e:
@@ -1384,36 +1489,102 @@ class MeshtasticUDPDecoder:
         # Create capture directory if it doesn't exist
         os.makedirs(self.capture_dir, exist_ok=True)
         
-        # Get current date for filename
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        self.current_capture_date = current_date
-        
-        # Open capture file
-        capture_filename = os.path.join(self.capture_dir, f"{current_date}.tsv")
-        self.capture_file = open(capture_filename, 'a', encoding='utf-8')
-        
+        capture_filename = self._open_capture_file()
         print(f"Capturing packets to: {capture_filename}")
+        
+        # Disk writes happen on a background thread so they never stall the receive loop
+        self._capture_queue = queue.SimpleQueue()
+        self._capture_thread = threading.Thread(target=self._capture_worker, name="capture-writer", daemon=True)
+        self._capture_thread.start()
+    
+    def _open_capture_file(self):
+        """Open today's capture file and note when it has to be rotated"""
+        now = datetime.now()
+        self.current_capture_date = now.strftime("%Y-%m-%d")
+        
+        # Local midnight; comparing against this avoids formatting the date for every packet
+        next_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self._capture_rotate_at = next_midnight.timestamp()
+        
+        # Binary mode with a large buffer so bursts of packets are written in few syscalls
+        capture_filename = os.path.join(self.capture_dir, f"{self.current_capture_date}.tsv")
+        self.capture_file = open(capture_filename, 'ab', buffering=_CAPTURE_BUFFER_SIZE)
+        return capture_filename
     
     def capture_packet(self, data):
-        """Capture packet to file in TSV format"""
-        if not self.capture_file:
+        """Queue a packet for the capture writer thread"""
+        if not self._capture_queue:
             return
+        
+        # The writer thread only exits early on a write error; stop queueing and report it
+        if not self._capture_thread.is_alive():
+            self._capture_queue = None
+            raise self._capture_error
+        
+        # Copy out of the receive buffer, which is reused for the next datagram
+        self._capture_queue.put((time.time(), bytes(data)))
+    
+    def _capture_worker(self):
+        """Drain the capture queue into today's TSV file until the None sentinel arrives"""
+        capture_queue = self._capture_queue
+        pending = 0
+        last_flush = time.monotonic()
+        
+        try:
+            while True:
+                try:
+                    item = capture_queue.get(timeout=_CAPTURE_FLUSH_INTERVAL)
+                except queue.Empty:
+                    item = ()
+                
+                if item is None:
+                    break
+                
+                if item:
+                    timestamp, data = item
+                    
+                    # Check if date has changed (for daily rotation)
+                    if timestamp >= self._capture_rotate_at:
+                        # Close current file and open new one
+                        self.capture_file.close()
+                        capture_filename = self._open_capture_file()
+                        print(f"Rotated capture to: {capture_filename}")
+                    
+                    self.capture_file.write(f"{timestamp}\t{data.hex()}\n".encode('ascii'))
+                    pending += 1
+                
+                # Flush in batches rather than per packet
+                if pending and (pending >= _CAPTURE_FLUSH_PACKETS or
+                                time.monotonic() - last_flush >= _CAPTURE_FLUSH_INTERVAL):
+                    self.capture_file.flush()
+                    pending = 0
+                    last_flush = time.monotonic()
             
-        # Check if date has changed (for daily rotation)
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if current_date != self.current_capture_date:
-            # Close current file and open new one
             self.capture_file.close()
-            self.current_capture_date = current_date
-            capture_filename = os.path.join(self.capture_dir, f"{current_date}.tsv")
-            self.capture_file = open(capture_filename, 'a', encoding='utf-8')
-            print(f"Rotated capture to: {capture_filename}")
-        
-        # Write timestamp and hex data
-        timestamp = time.time()
-        hex_data = data.hex()
-        self.capture_file.write(f"{timestamp}\t{hex_data}\n")
-        self.capture_file.flush()  # Ensure data is written immediately
+        except OSError as e:
+            # Disk full, permissions, etc. - record the error so capture_packet can surface it
+            self._capture_error = e
+            print(f"✗ Error writing capture file: {e}")
+            try:
+                self.capture_file.close()
+            except OSError:
+                pass
+
+    def close_capture(self):
+        """Stop the capture writer, letting it write out everything still queued"""
+        if not self._capture_thread:
+            return
+        
+        if self._capture_queue:
+            self._capture_queue.put(None)
+        self._capture_thread.join()
+        self._capture_thread = None
+        self._capture_queue = None
+        self.capture_file = None
+        if self._capture_error:
+            print(f"Capture stopped after a write error: {self._capture_error}")
+        else:
+            print(f"Capture file closed")
 
     def start_monitoring(self):
         """Start monitoring UDP packets"""
@@ -1434,13 +1605,15 @@ class MeshtasticUDPDecoder:
         try:
             while self.running:
                 try:
-                    # Receive packet (with timeout to allow checking self.running)
-                    self.sock.settimeout(1.0)
-                    data, addr = self.sock.recvfrom(4096)
+                    # Receive packet (the socket timeout allows checking self.running)
+                    nbytes, addr = self.sock.recvfrom_into(self._rx_buf)
                     
-                    if data:
+                    if nbytes:
+                        # View into the reused receive buffer; only valid until the next receive
+                        data = self._rx_view[:nbytes]
+                        
                         # Capture packet if requested
-                        if self.capture_file:
+                        if self._capture_queue:
                             self.capture_packet(data)
                         
                         # Process packet for display
@@ -1459,7 +1632,5 @@ class MeshtasticUDPDecoder:
         finally:
             if self.sock:
                 self.sock.close()
-            if self.capture_file:
-                self.capture_file.close()
-                print(f"Capture file closed")
+            self.close_capture()
             self.print_statistics()
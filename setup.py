@@ -38,7 +38,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -48,7 +47,7 @@ setup(
         "Topic :: System :: Monitoring",
         "Topic :: System :: Networking :: Monitoring",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=read_requirements(),
     entry_points={
         "console_scripts": [